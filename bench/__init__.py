@@ -0,0 +1,5 @@
+"""
+Deterministic benchmarks for oneLedWatch.py on the host simulator.
+
+See bench/run.py.
+"""
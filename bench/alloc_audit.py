@@ -0,0 +1,174 @@
+"""
+Allocation audit: heap objects the firmware allocates per press and tick.
+
+    python -m bench.alloc_audit
+    python -m bench.alloc_audit --set DISPLAY_BACKEND=pio
+
+Runs the firmware in the simulator under tracemalloc, after boot and a
+first press (one-time allocations), and looks at the objects a firmware
+frame can see after each of its opcodes: the stack and locals of a
+coroutine (main(), display_loop(), ...), the locals of a plain function,
+call arguments and return values. A new one is counted once, by type,
+at its line, so temporaries are seen as well (a "%d" % n passed to
+len(), a tuple, a bytearray(64)). New means traced by tracemalloc to a
+firmware line, or, for tuple, list, dict and float (CPython reuses
+those from free lists, untraced), unknown when the audit started. Ints
+below 2**30 are not counted: MicroPython keeps them as small ints, off
+the heap.
+
+A temporary that lives only on the stack of a plain function (not a
+coroutine) is not seen: CPython shows that stack to nobody. Frames and
+tracebacks are CPython's own.
+
+The objects uasyncio allocates on the Pico (tasks, ThreadSafeFlag.wait()
+generators, a CancelledError) are counted by the simulated loop and
+added in as "uasyncio". So are the IOQueue entries, as "uasyncio
+IOQueue": one per flag wait that parks (an entry list and a poller
+registration). Those are not zero on the Pico, but they are the floor:
+only a ThreadSafeFlag wakes uasyncio from an IRQ, and an Event
+allocates its wait() generator instead.
+
+Prints JSON per run (presses in the configured CLOCK_MODE, then an
+hour of "tick" and of "minute" mode) with the allocating lines, and
+exits with status 1 if a press or tick allocated anything but IOQueue
+entries ("avoidable").
+
+On the Pico, set LOG_DEBUG = const(1): micropython.mem_info() is
+printed after every display, and its "used" figure should stay put
+from press to press.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+import types
+from collections import Counter
+
+from bench.run import parse_setting
+from sim import Watch
+from sim.harness import FIRMWARE
+
+PRESSES = 10
+HOUR_MS = 3_600_000
+SMALL_INT = 1 << 30             # MicroPython small ints: -2**30 .. 2**30 - 1
+CPYTHON = (types.FrameType, types.TracebackType)
+FREE_LISTS = (tuple, list, dict, float)
+
+
+class Audit:
+    """Counts firmware allocations, checked after every firmware opcode."""
+
+    def __init__(self, w):
+        self.w = w
+        self.path = w.fw.__file__
+        self.coros = {}             # frame -> coroutine running in it
+        self.sites = Counter()
+        self.known = {}             # id -> every object seen (kept alive)
+
+    def start(self):
+        objs = gc.get_objects()     # and the untracked ones they hold
+        for obj in objs + gc.get_referents(*objs):
+            self.known[id(obj)] = obj
+        tracemalloc.start()
+        sys.settrace(self.trace)
+
+    def stop(self):
+        sys.settrace(None)
+        tracemalloc.stop()
+
+    def trace(self, frame, event, arg):
+        if frame.f_code.co_filename != self.path:
+            return None
+        frame.f_trace_lines = False
+        frame.f_trace_opcodes = True
+        self.check(frame, ())       # "call": the arguments are locals
+        return self.step
+
+    def step(self, frame, event, arg):
+        self.check(frame, (arg,) if event == "return" else ())
+        return self.step
+
+    def check(self, frame, extra):
+        for obj in self.visible(frame, extra):
+            if id(obj) in self.known:
+                continue
+            self.known[id(obj)] = obj
+            if isinstance(obj, FREE_LISTS):
+                line = frame.f_lineno
+            else:
+                tb = tracemalloc.get_object_traceback(obj)
+                if tb is None or tb[0].filename != self.path:
+                    continue        # from before the audit, or the sim's
+                line = tb[0].lineno
+            if isinstance(obj, CPYTHON) \
+                    or type(obj) is int and -SMALL_INT <= obj < SMALL_INT:
+                continue
+            self.sites["line %d %s" % (line, type(obj).__name__)] += 1
+
+    def visible(self, frame, extra):
+        if frame.f_code.co_flags & 0x80:   # CO_COROUTINE
+            coro = self.coros.get(frame)
+            if coro is None:
+                for t in self.w.loop.tasks:
+                    if t.coro.cr_frame is frame:
+                        coro = self.coros[frame] = t.coro
+            if coro is not None:
+                return gc.get_referents(coro) + list(extra)
+        return list(frame.f_locals.values()) + list(extra)
+
+
+def audit(n, run, **settings):
+    """Run n units of run(w) under tracemalloc, after boot and one press."""
+    w = Watch(**settings)
+    w.fw.log_event = w.fw.log_event.__wrapped__     # the probe formats text
+    a = Audit(w)
+    w.press(at_ms=1_000)
+    w.run(60_000)
+    allocs, entries = w.loop.allocs, w.loop.io_entries
+    a.start()
+    try:
+        run(w)
+    finally:
+        a.stop()
+    if w.loop.allocs > allocs:
+        a.sites["uasyncio"] = w.loop.allocs - allocs
+    if w.loop.io_entries > entries:
+        a.sites["uasyncio IOQueue"] = w.loop.io_entries - entries
+    total = sum(a.sites.values())
+    avoidable = total - a.sites["uasyncio IOQueue"]
+    return {"units": n, "allocations": total, "per_unit": total / n,
+            "avoidable": avoidable, "sites": dict(a.sites)}
+
+
+def presses(w):
+    for i in range(PRESSES):
+        w.press(at_ms=w.now_ms + 1_000)
+        w.run(60_000)
+
+
+def idle_hour(w):
+    w.run(HOUR_MS)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                    help="override a firmware setting")
+    args = ap.parse_args(argv)
+
+    settings = dict(parse_setting(s) for s in args.set)
+    result = {
+        "press": audit(PRESSES, presses, **settings),
+        "tick": audit(3600, idle_hour, **dict(settings, CLOCK_MODE="tick")),
+        "minute": audit(60, idle_hour, **dict(settings, CLOCK_MODE="minute")),
+        "firmware": FIRMWARE,
+    }
+    sys.stdout.write(json.dumps(result, indent=2, sort_keys=True) + "\n")
+    if any(r["avoidable"] for r in result.values() if isinstance(r, dict)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Battery-life estimate for a cell capacity and press-rate profile.
+
+    python -m bench.battery --capacity 1000 --presses-per-hour 4
+    python -m bench.battery --set CLOCK_MODE=tick --current idle=15
+
+Simulates one day with presses spread evenly over it, integrates the
+sim.energy model and prints JSON.
+"""
+
+import argparse
+import json
+import sys
+
+from bench.run import parse_setting
+from sim import Watch, energy
+
+DAY_MS = 86_400_000
+
+
+def simulate_day(presses_per_hour, **settings):
+    w = Watch(**settings)
+    n = int(presses_per_hour * 24)
+    for i in range(n):
+        w.press(at_ms=1_000 + i * DAY_MS // n)
+    w.run(DAY_MS)
+    return w
+
+
+def estimate(capacity_mah, presses_per_hour, currents=None, **settings):
+    w = simulate_day(presses_per_hour, **settings)
+    cur = dict(energy.CURRENTS_MA, **(currents or {}))
+    r = energy.report(w, currents=cur, capacity_mah=capacity_mah)
+    r.update(capacity_mah=capacity_mah, presses_per_hour=presses_per_hour,
+             currents_ma=cur)
+    return r
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--capacity", type=float, default=1000.0,
+                    help="cell capacity in mAh (default 1000)")
+    ap.add_argument("--presses-per-hour", type=float, default=4.0)
+    ap.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                    help="override a firmware setting")
+    ap.add_argument("--current", action="append", default=[],
+                    metavar="STATE=MA", help="override a state current")
+    args = ap.parse_args(argv)
+
+    settings = dict(parse_setting(s) for s in args.set)
+    currents = {k: float(v) for k, v in
+                (parse_setting(s) for s in args.current)}
+    r = estimate(args.capacity, args.presses_per_hour, currents, **settings)
+    r["settings"] = settings
+    sys.stdout.write(json.dumps(r, indent=2, sort_keys=True) + "\n")
+
+
+if __name__ == "__main__":
+    main()
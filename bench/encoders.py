@@ -0,0 +1,58 @@
+"""
+Read-time benchmark of the time encodings in encoders.py.
+
+    python -m bench.encoders
+
+For every encoder, over all 720 times: display duration (first LED on
+to last LED off) and LED on-time, mean and worst case, plus the worst
+pulse count. Each encoder is also played once through the firmware in
+the simulator (worst-case time) as a cross-check of the table path.
+"""
+
+import json
+import sys
+
+import encoders
+from bench import metrics
+from sim import Watch
+
+
+def stats(name):
+    encoder = encoders.ENCODERS[name]
+    duration, on_time, pulses = [], [], []
+    worst = None
+    for h in range(1, 13):
+        for m in range(60):
+            runs = encoders.runs(encoder, h, m)
+            if len(runs) % 2 == 0:
+                runs = runs[:-1]            # trailing pause: LED already off
+            duration.append(sum(runs))
+            on_time.append(sum(runs[0::2]))
+            pulses.append(len(runs[0::2]))
+            if duration[-1] == max(duration):
+                worst = "%02d:%02d" % (h, m)
+    return {
+        "display_ms": {"mean": sum(duration) / 720, "max": max(duration)},
+        "led_on_ms": {"mean": sum(on_time) / 720, "max": max(on_time)},
+        "pulses_max": max(pulses),
+        "worst_time": worst,
+        "sim_display_ms": simulate(name, worst),
+    }
+
+
+def simulate(name, hhmm):
+    h, m = map(int, hhmm.split(":"))
+    w = Watch(ENCODER=name, hour=h, minute=m)
+    w.press(at_ms=1_000)
+    w.run(90_000)
+    (_, group), = metrics.displays(w)
+    return metrics._end(group) - group[0][0]
+
+
+def main():
+    result = {name: stats(name) for name in encoders.ENCODERS}
+    sys.stdout.write(json.dumps(result, indent=2, sort_keys=True) + "\n")
+
+
+if __name__ == "__main__":
+    main()
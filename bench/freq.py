@@ -0,0 +1,63 @@
+"""
+Clock governor benchmark: idle current and ISR latency per clk_sys step.
+
+    python -m bench.freq
+    python -m bench.freq --set CLOCK_MODE=tick
+
+For each machine.freq() step (FREQ_IDLE = FREQ_DISPLAY = step): mean
+current of an idle hour awake (POWER_MODE "awake") and with lightsleep,
+the modelled ISR time, and the LED edge error of a press against the
+125 MHz run with both PIO front/back ends, which checks that the state
+machines are re-derived after the switch. Steps are reachable with
+PLL_SYS (VCO >= 750 MHz, post dividers <= 49): the sim's machine.freq()
+raises ValueError for others, like MicroPython's. isr_us_modelled is
+the energy model's ISR cost scaled by clock, not a measurement.
+"""
+
+import argparse
+import json
+import sys
+
+from bench import metrics
+from bench.run import parse_setting
+from bench.scenarios import idle_hour
+from sim import Watch, energy
+
+STEPS_HZ = (18_000_000, 24_000_000, 48_000_000, 96_000_000, 125_000_000)
+
+
+def pio_press(**settings):
+    w = Watch(**dict(settings, BUTTON_FRONTEND="pio", DISPLAY_BACKEND="pio"))
+    w.press(at_ms=1_000)
+    w.run(60_000)
+    return w
+
+
+def step(hz, reference, **settings):
+    settings = dict(settings, FREQ_IDLE=hz, FREQ_DISPLAY=hz)
+    w = pio_press(**settings)
+    return {
+        "idle_ma_awake": energy.report(
+            idle_hour(**dict(settings, POWER_MODE="awake")))["mean_ma"],
+        "idle_ma_lightsleep": energy.report(
+            idle_hour(**settings))["mean_ma"],
+        "isr_us_modelled": energy.isr_us(hz),
+        "pio_edge_error_ms": metrics.edge_error(reference, w),
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                    help="override a firmware setting")
+    args = ap.parse_args(argv)
+
+    settings = dict(parse_setting(s) for s in args.set)
+    reference = pio_press(**dict(settings, FREQ_IDLE=0, FREQ_DISPLAY=0))
+    result = [dict(step(hz, reference, **settings), mhz=hz / 1e6)
+              for hz in STEPS_HZ]
+    sys.stdout.write(json.dumps(result, indent=2, sort_keys=True) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Metrics from a finished sim.Watch run. All times in ms of virtual time.
+"""
+
+from sim import energy
+
+HOUR_MS = 3_600_000
+DISPLAY_GAP_MS = 2_000      # LED dark longer than this ends a display
+
+
+def shown_times(w):
+    """Times main() displayed, from its "Show time: hh:mm" log lines."""
+    return [msg.rsplit(": ", 1)[1] for _, msg in w.log
+            if "Show time: " in msg]
+
+
+def displays(w):
+    """Split LED pulses into displays, each with the press that started it.
+
+    The starting press is the last scripted press between the previous
+    display and this one, so presses ignored during a display or
+    rejected as noise don't count.
+    """
+    groups = []
+    for t, d in w.pulses():
+        if groups and t - _end(groups[-1]) <= DISPLAY_GAP_MS:
+            groups[-1].append((t, d))
+        else:
+            groups.append([(t, d)])
+    presses = sorted(set(w.presses))
+    out, prev_end = [], float("-inf")
+    for group in groups:
+        start = [p for p in presses if prev_end <= p <= group[0][0]]
+        if start:
+            out.append((start[-1], group))
+        prev_end = _end(group)
+    return out
+
+
+def _end(group):
+    return group[-1][0] + group[-1][1]
+
+
+def latencies(w):
+    """Press-to-first-pulse time of each display."""
+    return [group[0][0] - p for p, group in displays(w)]
+
+
+def collect(w):
+    hours = w.now_ms / HOUR_MS
+    power = energy.report(w)
+    latency = latencies(w)
+    duration = [_end(group) - group[0][0] for _, group in displays(w)]
+
+    m = {
+        "sim_ms": w.now_ms,
+        "wakeups_per_hour": w.loop.wakeups / hours,
+        "isr_invocations": w.board.isr_count,
+        "isr_per_hour": w.board.isr_count / hours,
+        "isr_max_us": w.board.isr_max_us,
+        "presses": len(set(w.presses)),
+        "displays": len(duration),
+        "press_to_first_pulse_ms": _summary(latency),
+        "display_duration_ms": _summary(duration),
+        "led_on_ms": sum(d for _, d in w.pulses()),
+        "shown": shown_times(w),
+        "serial_lines": len(w.serial),
+        "fw_stats": dict(w.fw.stats),
+        "mean_ma": power["mean_ma"],
+        "cpu_clocked_ms": cpu_clocked_ms(power),
+        "usb_ma": usb_ma(power),
+    }
+    if hasattr(w.fw, "power_transitions"):
+        m["power_transitions"] = w.fw.power_transitions()
+    if getattr(w.fw, "time_uncertain", False):
+        m["time_uncertain"] = True
+    if hasattr(w, "clock_errors"):
+        m["clock_samples"] = w.clock_samples
+        m["clock_errors"] = w.clock_errors
+    if hasattr(w, "aborts"):
+        m["time_to_abort_ms"] = _summary(abort_latency(w))
+    ref = getattr(w, "reference", None)
+    if ref is not None:
+        a, b = shown_times(ref), shown_times(w)
+        m["reference_mismatches"] = sum(x != y for x, y in zip(a, b)) \
+            + abs(len(a) - len(b))
+        m["reference_edge_error_ms"] = edge_error(ref, w)
+        m["reference_press_to_first_pulse_ms"] = _summary(latencies(ref))
+        m["reference_isr_invocations"] = ref.board.isr_count
+        m["reference_wakeups_per_hour"] = ref.loop.wakeups / hours
+        ref_power = energy.report(ref)
+        m["reference_mean_ma"] = ref_power["mean_ma"]
+        m["reference_cpu_clocked_ms"] = cpu_clocked_ms(ref_power)
+        m["reference_usb_ma"] = usb_ma(ref_power)
+    return m
+
+
+def failures(w, m):
+    """Limits a scenario set in w.limits that its metrics m break.
+
+    w.limits maps a metric name (dotted to reach into a dict, e.g.
+    "fw_stats.aborts") to a maximum or a (min, max) pair; a missing or
+    None metric breaks its limit.
+    """
+    out = []
+    for name, limit in getattr(w, "limits", {}).items():
+        value = m
+        for key in name.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        lo, hi = limit if isinstance(limit, tuple) else (None, limit)
+        if value is None or (lo is not None and value < lo) or value > hi:
+            out.append("%s = %r, limit %r" % (name, value, limit))
+    return out
+
+
+def cpu_clocked_ms(power):
+    """Time with clk_sys running (awake, IRQ, uasyncio idle), not asleep."""
+    st = power["state_us"]
+    return (st["awake"] + st["irq"] + st["idle"]) / 1000
+
+
+def usb_ma(power):
+    """Mean current of PLL_USB and the USB clock domain over the run."""
+    hours = power["state_us"]["total"] / 3.6e9
+    return power["mah_by_state"]["usb"] / hours if hours else 0.0
+
+
+def abort_latency(w):
+    """Per aborting press: ms until the LED is off for good (0 if it
+    already was and no pulse followed)."""
+    edges = w.led_edges
+    out = []
+    for a in w.aborts:
+        nxt = min([p for p in w.presses if p > a], default=float("inf"))
+        after = [(t, v) for t, v in edges if a <= t < nxt]
+        if after and after[-1][1]:
+            out.append(float("inf"))        # LED left on: abort failed
+        else:
+            out.append(after[-1][0] - a if after else 0.0)
+    return out
+
+
+def edge_error(ref, w):
+    """Worst edge offset between two runs, each display aligned on its
+    first edge; None if the pulse patterns differ."""
+    da, db = displays(ref), displays(w)
+    if len(da) != len(db):
+        return None
+    worst = 0.0
+    for (_, ga), (_, gb) in zip(da, db):
+        if len(ga) != len(gb):
+            return None
+        for (ta, la), (tb, lb) in zip(ga, gb):
+            worst = max(worst, abs((ta - ga[0][0]) - (tb - gb[0][0])),
+                        abs((ta + la - ga[0][0]) - (tb + lb - gb[0][0])))
+    return round(worst, 3)
+
+
+def _summary(xs):
+    if not xs:
+        return None
+    return {"mean": sum(xs) / len(xs), "max": max(xs), "min": min(xs)}
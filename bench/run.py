@@ -0,0 +1,76 @@
+"""
+Run benchmark scenarios in the simulator and print JSON metrics.
+
+    python -m bench.run                        # all scenarios
+    python -m bench.run single_press rollover
+    python -m bench.run --set CLOCK_MODE=tick -o before.json
+    python -m bench.run --check
+
+Output is deterministic (virtual time only), so two runs can be diffed
+between commits. With --check, the limits scenarios set on their
+metrics (w.limits) are checked too: broken ones go to stderr and the
+exit status is 1.
+"""
+
+import argparse
+import ast
+import json
+import sys
+
+from bench import metrics
+from bench.scenarios import SCENARIOS
+
+
+def parse_setting(s):
+    name, _, value = s.partition("=")
+    try:
+        value = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        pass                        # bare string, e.g. CLOCK_MODE=tick
+    return name, value
+
+
+def run(names, settings):
+    """Metrics of each scenario, and the limits its metrics break."""
+    result, failed = {}, {}
+    for name in names:
+        w = SCENARIOS[name](**settings)
+        result[name] = metrics.collect(w)
+        failed[name] = metrics.failures(w, result[name])
+    return result, failed
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("scenario", nargs="*",
+                    help="scenarios to run (default: all): "
+                    + ", ".join(SCENARIOS))
+    ap.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                    help="override a firmware setting")
+    ap.add_argument("-o", "--out", help="write JSON here instead of stdout")
+    ap.add_argument("--check", action="store_true",
+                    help="exit with status 1 if a scenario breaks a limit")
+    args = ap.parse_args(argv)
+
+    for name in args.scenario:
+        if name not in SCENARIOS:
+            ap.error("unknown scenario: " + name)
+    settings = dict(parse_setting(s) for s in args.set)
+    scenarios, failed = run(args.scenario or list(SCENARIOS), settings)
+    result = {"settings": settings, "scenarios": scenarios}
+    text = json.dumps(result, indent=2, sort_keys=True)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+    if args.check:
+        for name, broken in failed.items():
+            for line in broken:
+                sys.stderr.write("%s: %s\n" % (name, line))
+        if any(failed.values()):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
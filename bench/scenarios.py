@@ -0,0 +1,438 @@
+"""
+Scripted user sessions. Each scenario takes firmware settings, runs a
+sim.Watch and returns it; bench.metrics turns it into numbers.
+"""
+
+import random
+
+from sim import Watch
+
+HOUR_MS = 3_600_000
+LATENCY_MS = 5              # scheduler_latency: worst injected wake delay
+BOUNCE = {"bounces": 3, "bounce_ms": 8}     # edges further apart than COALESCE_MS
+
+
+def compare(script, reference, variant, **settings):
+    """Run script(w, False) on a Watch built from settings updated by the
+    reference dict, then script(w, True) on one updated by the variant
+    dict (Watch keyword arguments: firmware settings, usb).
+
+    Returns the variant Watch; the reference run is kept as w.reference.
+    """
+    runs = []
+    for is_variant, extra in ((False, reference), (True, variant)):
+        w = Watch(**dict(settings, **extra))
+        script(w, is_variant)
+        runs.append(w)
+    runs[1].reference = runs[0]
+    return runs[1]
+
+
+def one_press(w, is_variant):
+    """One clean press, then wait for the display to finish."""
+    w.press(at_ms=1_000)
+    w.run(60_000)
+
+
+def hourly_presses(w, is_variant):
+    """A day of hourly presses, each a minute later in the hour."""
+    for i in range(24):
+        w.press(at_ms=1_000 + i * HOUR_MS + i * 61_000)
+    w.run(24 * HOUR_MS + 30 * 60_000)
+
+
+def idle_hour(**settings):
+    """One hour, no presses: pure timekeeping cost."""
+    w = Watch(**settings)
+    w.run(HOUR_MS)
+    return w
+
+
+def single_press(**settings):
+    """One clean press, then wait for the display to finish."""
+    w = Watch(**settings)
+    w.press(at_ms=1_000)
+    w.run(60_000)
+    return w
+
+
+def press_storm(**settings):
+    """20 bouncing presses 150 ms apart, then silence."""
+    w = Watch(**settings)
+    for i in range(20):
+        w.press(at_ms=1_000 + i * 150, hold_ms=80, bounces=5)
+    w.run(120_000)
+    return w
+
+
+def storm_release(**settings):
+    """press_storm while held: a clean press, 60 edges of chatter (IRQ
+    off for STORM_HOLDOFF_MS), released during the holdoff. The next
+    clean press must show the time again."""
+    w = Watch(**settings)
+    w.press(at_ms=1_000, hold_ms=800)
+    w.press(at_ms=1_200, hold_ms=600, bounces=30, bounce_ms=8)
+    w.press(at_ms=41_000)
+    w.run(80_000)
+    w.limits = {"fw_stats.presses": (2, 2), "displays": (2, 2)}
+    return w
+
+
+def noisy_contact(**settings):
+    """Flaky contact: 2 s of edges every 4 ms, then one clean press."""
+    w = Watch(**settings)
+    w.press(at_ms=1_000, hold_ms=2_000, bounces=500, bounce_ms=4)
+    w.press(at_ms=10_000)
+    w.run(60_000)
+    return w
+
+
+def abort(**settings):
+    """Second press cancels a display: once with LED on, once with it off."""
+    w = Watch(**settings)
+    abort_presses(w, False)
+    return w
+
+
+def abort_presses(w, bouncy):
+    w.aborts = [3_000, 33_750]
+    bounce = BOUNCE if bouncy else {}
+    w.press(at_ms=1_000, **bounce)
+    w.press(at_ms=w.aborts[0], **bounce)    # during the 2nd hour pulse
+    w.press(at_ms=31_000, **bounce)
+    w.press(at_ms=w.aborts[1], **bounce)    # between the 2nd and 3rd pulse
+    w.run(60_000)
+
+
+def bouncy_press(**settings):
+    """single_press with contact bounce wider apart than COALESCE_MS:
+    still one display with the pulses of a clean press, no abort.
+
+    Returns the bouncy Watch; the clean run is kept as w.reference.
+    """
+    def script(w, bouncy):
+        w.press(at_ms=1_000, hold_ms=300, **(BOUNCE if bouncy else {}))
+        w.run(60_000)
+
+    w = compare(script, {}, {}, **settings)
+    w.limits = {"fw_stats.presses": (1, 1), "fw_stats.aborts": 0,
+                "reference_mismatches": 0, "reference_edge_error_ms": 0}
+    return w
+
+
+def bouncy_abort(**settings):
+    """abort with every press bouncing like bouncy_press: each press
+    acts once, the same two displays are aborted as with clean presses.
+
+    Returns the bouncy Watch; the clean run is kept as w.reference.
+    """
+    w = compare(abort_presses, {}, {}, **settings)
+    w.limits = {"fw_stats.presses": (2, 2), "fw_stats.aborts": (2, 2),
+                "reference_mismatches": 0, "reference_edge_error_ms": 0}
+    return w
+
+
+def rollover(**settings):
+    """Presses just before and after 11:59 -> 12:00 (AM -> PM)."""
+    settings.setdefault("hour", 11)
+    settings.setdefault("minute", 59)
+    settings.setdefault("second", 0)
+    w = Watch(**settings)
+    w.press(at_ms=1_000)            # 11:59
+    w.press(at_ms=61_000)           # 12:00
+    w.run(120_000)
+    if (settings["hour"], settings["minute"]) == (11, 59):
+        shown = ["11:59", "12:00"]
+        w.limits = {"shown": (shown, shown)}
+    return w
+
+
+def sleep_race(**settings):
+    """A press whose edge comes just as power_manager() goes to sleep
+    (injected into set_power(SLEEP)): shown within about DEBOUNCE_MS,
+    not at the next wake up to SLEEP_MAX_MS later. Always lightsleep
+    with the IRQ front end: the race is theirs."""
+    w = Watch(**dict(settings, POWER_MODE="lightsleep",
+                     BUTTON_FRONTEND="irq"))
+    fw = w.fw
+    set_power, armed = fw.set_power, []
+
+    def racing(state):
+        if state == fw.SLEEP and armed == [True]:
+            armed.append(False)
+            w.presses.append(w.now_ms)
+            w.board.drive(fw.BUTTON_PIN, 0)
+            w.board.at(w.board.now_us + 200_000,
+                       lambda: w.board.drive(fw.BUTTON_PIN, 1))
+        set_power(state)
+
+    fw.set_power = racing
+    w.board.at(5_000_000, lambda: armed.append(True))
+    w.run(2 * 60_000)
+    w.limits = {"press_to_first_pulse_ms.max": fw.DEBOUNCE_MS + 5}
+    return w
+
+
+def clock_agreement(**settings):
+    """Same day of presses in "tick" and "rtc" mode: shown times must match.
+
+    Returns the rtc-mode Watch; the tick-mode run is kept as w.reference.
+    """
+    w = compare(hourly_presses, {"CLOCK_MODE": "tick"},
+                {"CLOCK_MODE": "rtc"}, **settings)
+    w.limits = {"reference_mismatches": 0}
+    return w
+
+
+def tick_day(**settings):
+    """Tick mode for 24 h, current_time() checked every second against
+    the start time plus elapsed seconds. Wrong samples in w.clock_errors.
+    """
+    settings.setdefault("CLOCK_MODE", "tick")
+    w = Watch(**settings)
+    check_clock(w, 24 * 3600)
+    w.limits = {"clock_errors": 0}
+    return w
+
+
+def minute_alarm(**settings):
+    """A day in "minute" mode against the 1 Hz "tick" mode, with presses
+    at odd sub-minute phases: shown times must match. A third run, in
+    minute mode, checks current_time() every second (w.clock_errors);
+    the two compared runs are not sampled, so their wakeups are the
+    firmware's own.
+
+    Returns the minute-mode Watch; the tick run is kept as w.reference.
+    """
+    def presses(w):
+        for i in range(24):
+            w.press(at_ms=1_000 + i * HOUR_MS + i * 2_507)
+
+    def script(w, is_variant):
+        presses(w)
+        w.run(24 * HOUR_MS)
+
+    w = compare(script, {"CLOCK_MODE": "tick"}, {"CLOCK_MODE": "minute"},
+                **settings)
+    checked = Watch(**dict(settings, CLOCK_MODE="minute"))
+    presses(checked)
+    check_clock(checked, 24 * 3600)
+    w.clock_samples, w.clock_errors = checked.clock_samples, \
+        checked.clock_errors
+    w.limits = {"clock_errors": 0, "reference_mismatches": 0}
+    return w
+
+
+def check_clock(w, seconds):
+    """Run w for seconds, comparing current_time() mid-second to the
+    start time plus elapsed seconds; counts in w.clock_samples/errors."""
+    fw = w.fw
+    start = fw.day_seconds
+    w.clock_samples, w.clock_errors = 0, 0
+    w.run(500)                      # sample mid-second, between ticks
+    for s in range(seconds + 1):
+        t = (start + s) % 86400
+        want = (t // 43200 << 15 | ((t // 3600 - 1) % 12 + 1) << 8
+                | t // 60 % 60)
+        w.clock_samples += 1
+        w.clock_errors += fw.current_time() != want
+        w.run(1_000)
+
+
+def tick_dropped(**settings):
+    """Tick mode for 1 h with a third of the timer callbacks lost (seeded)
+    plus a 30 s gap: after every delivered tick the counter must equal
+    the start time plus elapsed seconds. Wrong ticks in w.clock_errors.
+    Always tick mode: the check counts the periodic Timer's calls.
+    """
+    w = Watch(**dict(settings, CLOCK_MODE="tick"))
+    fw = w.fw
+    start = fw.day_seconds
+    rng = random.Random(17)
+    callback = fw.timer.callback
+    w.clock_samples, w.clock_errors = 0, 0
+
+    def lossy(t):
+        s = t.count
+        if rng.random() < 0.33 or 600 <= s < 630:
+            return
+        callback(t)
+        w.clock_samples += 1
+        w.clock_errors += fw.day_seconds != (start + s) % 86400
+
+    fw.timer.callback = lossy
+    w.run(HOUR_MS)
+    w.limits = {"clock_errors": 0}
+    return w
+
+
+def check_shown(w):
+    """Compare each shown time to the start time plus the seconds run
+    when it was logged; counts in w.clock_samples/errors. Cheap next to
+    check_clock(), and leaves the sleeps of the run alone."""
+    fw = w.fw
+    start = (fw.hour % 12 + 12 * fw.ampm) * 3600 + fw.minute * 60 \
+        + fw.second
+    w.clock_samples, w.clock_errors = 0, 0
+    for t, msg in w.log:
+        if "Show time: " in msg:
+            s = (start + int(t) // 1000) % 86400
+            w.clock_samples += 1
+            w.clock_errors += not msg.endswith(
+                "%02d:%02d" % (s // 3600 % 12 or 12, s // 60 % 60))
+
+
+def lightsleep(**settings):
+    """A day of presses with POWER_MODE "awake" and "lightsleep": shown
+    times and LED edges must match, current should drop.
+
+    Returns the lightsleep Watch; the awake run is kept as w.reference.
+    """
+    w = compare(hourly_presses, {"POWER_MODE": "awake"},
+                {"POWER_MODE": "lightsleep"}, **settings)
+    check_shown(w)
+    w.limits = {"reference_mismatches": 0, "reference_edge_error_ms": 0.1,
+                "clock_errors": 0}
+    return w
+
+
+def display_sleep(**settings):
+    """One press (05:43, 20 pulses) with DISPLAY_SLEEP off and on: LED
+    edges must match, clocked CPU time per display should drop.
+
+    Returns the DISPLAY_SLEEP Watch; the other run is w.reference.
+    """
+    w = compare(one_press, {"DISPLAY_SLEEP": False},
+                {"DISPLAY_SLEEP": True}, **settings)
+    check_shown(w)
+    w.limits = {"reference_mismatches": 0, "reference_edge_error_ms": 0.1,
+                "clock_errors": 0}
+    return w
+
+
+def dormant(**settings):
+    """Press, 8 h in the drawer, press twice more, with dormant after
+    DORMANT_AFTER_MIN (default 30) against lightsleep only. The RTC
+    stops in dormant too: time resumes where it stopped, so both later
+    presses show a time behind the reference, flagged time_uncertain.
+    Always lightsleep with the IRQ front end, which dormant needs.
+
+    Returns the dormant Watch; the lightsleep-only run is w.reference.
+    """
+    settings.setdefault("DORMANT_AFTER_MIN", 30)
+    settings.update(POWER_MODE="lightsleep", BUTTON_FRONTEND="irq")
+
+    def script(w, is_variant):
+        for t in (1_000, 8 * HOUR_MS, 8 * HOUR_MS + 40 * 60_000):
+            w.press(at_ms=t)
+        w.run(9 * HOUR_MS)
+
+    w = compare(script, {"DORMANT_AFTER_MIN": 0},
+                {"DORMANT_AFTER_MIN": settings["DORMANT_AFTER_MIN"]},
+                **settings)
+    w.limits = {"time_uncertain": (True, True), "reference_mismatches": (2, 2)}
+    return w
+
+
+def usb_unplug(**settings):
+    """Four hours of hourly presses on USB power, and booted on USB then
+    unplugged after a minute and plugged in again at 3.5 h: shown times
+    must match (the RTC moves off PLL_USB), current should drop.
+
+    Returns the unplugged Watch; the USB-powered run is w.reference.
+    """
+    def script(w, unplug):
+        if unplug:
+            w.plug(at_ms=60_000, usb=False)
+            w.plug(at_ms=3.5 * HOUR_MS)
+        for i in range(4):
+            w.press(at_ms=61_000 + i * HOUR_MS + i * 61_000)
+        w.run(4 * HOUR_MS + 30 * 60_000)
+
+    w = compare(script, {"usb": True}, {"usb": True}, **settings)
+    check_shown(w)
+    w.limits = {"reference_mismatches": 0, "clock_errors": 0}
+    return w
+
+
+def stalled_host(**settings):
+    """On USB power with a terminal that stops reading for 5 min: two
+    presses in that time, then the host reads again. Press-to-first-pulse
+    latency must not change; the log reaches the host late.
+
+    Returns the stalled Watch; the run with the host reading is
+    w.reference.
+    """
+    def script(w, stalled):
+        if stalled:
+            w.board.cdc_stalled = True
+            w.board.at(5 * 60_000_000,
+                       lambda: setattr(w.board, "cdc_stalled", False))
+        w.press(at_ms=1_000)
+        w.press(at_ms=40_000)
+        w.run(6 * 60_000)
+
+    w = compare(script, {"usb": True}, {"usb": True}, **settings)
+    w.limits = {"press_to_first_pulse_ms.max": w.fw.DEBOUNCE_MS + 5,
+                "displays": (2, 2), "reference_mismatches": 0}
+    return w
+
+
+def display_backends(**settings):
+    """Same presses with DISPLAY_BACKEND "cpu" and "pio": edges must match.
+
+    Returns the pio Watch; the cpu run is kept as w.reference.
+    """
+    def script(w, is_variant):
+        w.press(at_ms=1_000)
+        w.press(at_ms=40_000)
+        w.run(80_000)
+
+    w = compare(script, {"DISPLAY_BACKEND": "cpu"},
+                {"DISPLAY_BACKEND": "pio"}, **settings)
+    w.limits = {"reference_edge_error_ms": 0.1, "reference_mismatches": 0}
+    return w
+
+
+def scheduler_latency(**settings):
+    """Every uasyncio sleep wakes 0–5 ms late (seeded): edge error against
+    an unloaded run must stay within the injected latency plus 1 ms, not
+    grow along the display.
+
+    Returns the loaded Watch; the unloaded run is kept as w.reference.
+    """
+    def script(w, loaded):
+        if loaded:
+            rng = random.Random(13)
+            w.loop.latency = lambda: rng.randrange(LATENCY_MS * 1_000)
+        one_press(w, loaded)        # 05:43: 5 + 2 + 13 pulses
+
+    w = compare(script, {}, {}, **settings)
+    w.limits = {"reference_edge_error_ms": LATENCY_MS + 1,
+                "reference_mismatches": 0}
+    return w
+
+
+SCENARIOS = {
+    "idle_hour": idle_hour,
+    "single_press": single_press,
+    "press_storm": press_storm,
+    "storm_release": storm_release,
+    "noisy_contact": noisy_contact,
+    "abort": abort,
+    "bouncy_press": bouncy_press,
+    "bouncy_abort": bouncy_abort,
+    "rollover": rollover,
+    "sleep_race": sleep_race,
+    "clock_agreement": clock_agreement,
+    "tick_day": tick_day,
+    "tick_dropped": tick_dropped,
+    "minute_alarm": minute_alarm,
+    "lightsleep": lightsleep,
+    "display_sleep": display_sleep,
+    "dormant": dormant,
+    "usb_unplug": usb_unplug,
+    "stalled_host": stalled_host,
+    "display_backends": display_backends,
+    "scheduler_latency": scheduler_latency,
+}
@@ -0,0 +1,92 @@
+"""
+Time encodings for the One LED Watch.
+
+Each encoder turns (h 1–12, m 0–59) into groups of pulse lengths in ms.
+Pulses in a group are 500 ms apart, groups 1000 ms apart, empty groups
+are skipped. runs() flattens that to alternating ON, OFF, ON, ... run
+lengths, which build() packs into the pulse table format (see
+tools/gen_pulse_table.py). All lengths are multiples of UNIT_MS and at
+most 15 units, so each run fits a nibble.
+"""
+
+UNIT_MS = 250
+GAP_MS = 500        # between pulses of a group
+PAUSE_MS = 1000     # between groups
+
+
+def classic(h, m):
+    """Hours x 1000 ms, quarters x 500 ms, minutes mod 15 x 250 ms."""
+    return [[1000] * h, [500] * (m // 15), [250] * (m % 15)]
+
+
+def base5(h, m):
+    """Clock-face fives: hour as 5 x 1000 ms + 1 x 250 ms, then
+    5-minute steps x 500 ms, then minutes mod 5 x 250 ms."""
+    return [[1000] * (h // 5) + [250] * (h % 5),
+            [500] * (m // 5), [250] * (m % 5)]
+
+
+def binary(h, m):
+    """Hour in 4 bits, minute in 6 bits, MSB first: 750 ms = 1, 250 ms = 0."""
+    return [[750 if h >> i & 1 else 250 for i in range(3, -1, -1)],
+            [750 if m >> i & 1 else 250 for i in range(5, -1, -1)]]
+
+
+def morse(h, m):
+    """Decimal digits of h and mm, one group each: digit d as d // 5
+    long (750 ms) + d % 5 short (250 ms) pulses, 0 as one 1500 ms pulse."""
+    digits = ([h // 10] if h > 9 else []) + [h % 10, m // 10, m % 10]
+    return [[1500] if d == 0 else [750] * (d // 5) + [250] * (d % 5)
+            for d in digits]
+
+
+ENCODERS = {
+    "classic": classic,
+    "base5": base5,
+    "binary": binary,
+    "morse": morse,
+}
+
+
+def runs(encoder, h, m):
+    """Alternating [on, off, on, ...] lengths in ms, ending with a pulse
+    except for classic, which keeps its historic trailing 1 sec pause."""
+    out = []
+    for group in encoder(h, m):
+        if not group:
+            continue
+        if out:
+            out.append(PAUSE_MS)
+        for i, on in enumerate(group):
+            if i:
+                out.append(GAP_MS)
+            out.append(on)
+    if encoder is classic and m % 15 == 0:
+        out.append(PAUSE_MS)
+    return out
+
+
+def pack(lengths):
+    """Run lengths in ms -> nibbles in UNIT_MS, two per byte, 0 = end."""
+    nibbles = []
+    for ms in lengths:
+        units = ms // UNIT_MS
+        if units * UNIT_MS != ms or not 0 < units < 16:
+            raise ValueError("run of %d ms does not fit a nibble" % ms)
+        nibbles.append(units)
+    if len(nibbles) % 2:
+        nibbles.append(0)
+    return bytes(nibbles[i] << 4 | nibbles[i + 1]
+                 for i in range(0, len(nibbles), 2))
+
+
+def build(name):
+    """(INDEX, TABLE) for all 12 x 60 times with encoder name."""
+    encoder = ENCODERS[name]
+    index, table = bytearray(), bytearray()
+    for h in range(1, 13):
+        for m in range(60):
+            index += len(table).to_bytes(2, "little")
+            table += pack(runs(encoder, h, m))
+    index += len(table).to_bytes(2, "little")
+    return bytes(index), bytes(table)
@@ -6,6 +6,7 @@ MicroPython version
 - Quarters → 0–3 pulse 0.5sec
 - Minutes mod 15 → 0–14 pulse 0.25sec
 Pause 1sec in between.
+(default "classic" encoding, see ENCODER / encoders.py for shorter ones)
 
 Button: push to see time. Don't forget to count!
 Pico sleeps between secs (energy saver).
@@ -13,25 +14,99 @@ Pico sleeps between secs (energy saver).
 github.com/masd01
 """
 
+import gc
+import sys
 import machine
+import micropython
+import uselect
+import ustruct
 import utime
 import uasyncio as asyncio
-from machine import Pin, Timer, RTC
+from machine import Pin, Timer, RTC, mem32
+from micropython import const
 
 # ------------------------------------------------------------
 # Settings
 # ------------------------------------------------------------
 LED_PIN = 25          # GP25 – internal LED
 BUTTON_PIN = 3       # GP3 – Button (with pull-up)
+DEBOUNCE_MS = 20     # button must stay quiet this long after last edge
+COALESCE_MS = 5      # edges closer than this are one edge
+IRQ_RATE_CAP = 50    # edges/sec before button IRQ is switched off...
+STORM_HOLDOFF_MS = 1000   # ...for this long
+
+# Button front end:
+#   "irq" – pin IRQ on every edge, debounce in software
+#   "pio" – PIO state machine debounces, one IRQ per clean press
+BUTTON_FRONTEND = "irq"
+PIO_SM_BUTTON = 0    # state machine id for "pio"
+
+# Display back end:
+#   "cpu" – uasyncio toggles the LED between sleeps
+#   "pio" – PIO state machine fed by DMA plays the pulses, CPU idles
+DISPLAY_BACKEND = "cpu"
+PIO_SM_LED = 1       # state machine id for "pio"
+PIO_LED_FREQ = 10_000     # PIO cycles/sec -> 0.1 ms pulse resolution
+
+# Time encoding, see encoders.py: "classic", "base5", "binary", "morse"
+ENCODER = "classic"
+
+# CPU back end pulse timing:
+#   "deadline" – every edge at a fixed offset from display start
+#   "relative" – sleep each run length after the previous edge
+#                (scheduler delays add up over the display)
+PULSE_TIMING = "deadline"
+
+# Timekeeping mode:
+#   "rtc"      – internal RTC is the clock, read on press
+#   "tick"     – 1 sec Timer ISR counts seconds of day (fallback)
+#   "minute"   – like "tick", but a one-shot Timer alarm per minute
+#   "tickless" – no ISR, time computed from utime.ticks_ms() on press
+CLOCK_MODE = "rtc"
+
+# Power between events:
+#   "lightsleep" – machine.lightsleep() until a button edge or the next
+#                  clock deadline (needs BUTTON_FRONTEND = "irq": PIO
+#                  stops with clk_sys)
+#   "awake"      – uasyncio idles with the CPU clocked
+POWER_MODE = "lightsleep"
+SLEEP_MAX_MS = 60_000   # longest sleep when the clock needs no alarm
+DORMANT_AFTER_MIN = 0   # no press this long: dormant until pressed (0 = never)
+DISPLAY_SLEEP = True    # "cpu" display back end: lightsleep through each
+                        # LED run too (GPIO levels hold in lightsleep)
+
+# Clock governor, machine.freq() in Hz (0 = leave it alone). Boot,
+# including building a pulse table, runs at the default 125 MHz.
+FREQ_IDLE = 48_000_000      # waiting for presses, keeping time
+FREQ_DISPLAY = 48_000_000   # showing the time (raise for heavier work)
+
+# Power source: GP24 senses VBUS. On USB power logging and the REPL stay
+# (and the watch does not sleep); on battery log records stay in RAM
+# and PLL_USB is shut down.
+VBUS_PIN = 24           # GP24 – VBUS sense (high on USB power)
+
+# Log: binary records in a RAM ring, printed later when USB takes them.
+# Levels are compiled in or out (const: edit them here, watch_config.py
+# can't strip code).
+LOG_INFO = const(1)     # boot, shown times
+LOG_DEBUG = const(0)    # button storms, aborted displays, heap after displays
+LOG_RECORDS = 32        # ring size, oldest unprinted record is overwritten
 
 # ------------------------------------------------------------
 # Watch State (12h) set starting time
+# (start only: the running clock is day_seconds / RTC below)
 # ------------------------------------------------------------
 hour = 5         
 minute = 43
 second = 0
 ampm = 0            # 0=AM, 1=PM 
 
+# Optional overrides of the settings above (watch_config.py on flash)
+try:
+    from watch_config import *
+except ImportError:
+    pass
+
 # ------------------------------------------------------------
 # Initialization
 # ------------------------------------------------------------
@@ -40,115 +115,764 @@ led.value(0)
 
 button = Pin(BUTTON_PIN, Pin.IN, Pin.PULL_UP)
 
-# Internal RTC for precise time count
+# Internal RTC for precise time count (CLOCK_MODE = "rtc")
 rtc = RTC()
 
 # Flags for asyncio function
-button_pressed = False
+class Flag(asyncio.ThreadSafeFlag):
+    """ThreadSafeFlag whose wait() allocates no generator: it returns the
+    flag, awaited like uasyncio's sleep_ms() singleton. Parking still
+    costs uasyncio's IOQueue entry, the one allocation of a wait (an
+    Event would allocate its generator instead). One task waits on it,
+    awaiting wait() right away."""
+
+    def __init__(self):
+        super().__init__()
+        self.done = StopIteration()
+
+    def wait(self):
+        return self
+
+    def __iter__(self):
+        return self
+
+    __await__ = __iter__            # CPython (simulator)
+
+    def __next__(self):
+        if self.state:
+            self.state = 0
+            self.done.__traceback__ = None
+            raise self.done
+        asyncio.core._io_queue.queue_read(self)     # yield None: parked
+
+press_flag = Flag()     # set by button IRQ, main() waits on it
 time_updated = False
 
+# Counters (read from REPL or simulator)
+stats = {
+    "wakeups": 0,       # main() loop iterations
+    "presses": 0,       # presses accepted by debounce
+    "rejected": 0,      # edges rejected by debounce (bounce, glitch)
+    "raw_edges": 0,     # button IRQs
+    "dropped": 0,       # edges coalesced into the previous one
+    "storms": 0,        # times IRQ_RATE_CAP switched the IRQ off
+    "aborts": 0,        # displays cancelled by a second press
+    "catchups": 0,      # tick() calls that counted missed seconds
+    "log_lost": 0,      # log records overwritten before they were printed
+    "isr_max_us": 0,    # longest button_handler run
+}
+
+# Power state (see power_manager()):
+#   ACTIVE  – handling a button edge
+#   DISPLAY – showing the time
+#   IDLE    – nothing to do, may sleep
+#   SLEEP   – in machine.lightsleep()
+#   DORMANT – in machine.lightsleep() without timeout, button only
+ACTIVE, DISPLAY, IDLE, SLEEP, DORMANT = 0, 1, 2, 3, 4
+POWER_STATES = ("ACTIVE", "DISPLAY", "IDLE", "SLEEP", "DORMANT")
+power_state = ACTIVE
+power_moves = [0] * 25      # transitions, power_moves[old * 5 + new]
+power_flag = Flag()     # set on entering IDLE or DISPLAY
+
+def set_power(state):
+    global power_state
+    if state == power_state:
+        return
+    power_moves[power_state * 5 + state] += 1
+    if state <= IDLE and state != ACTIVE and power_state < SLEEP:
+        power_flag.set()
+    power_state = state
+
+def power_transitions():
+    """Transition counts by name, e.g. {"IDLE>SLEEP": 12}."""
+    return {POWER_STATES[i // 5] + ">" + POWER_STATES[i % 5]: n
+            for i, n in enumerate(power_moves) if n}
+
+# ------------------------------------------------------------
+# Log: fixed-size records in a preallocated ring
+# ------------------------------------------------------------
+# print() formats on the heap and blocks while the USB host doesn't
+# read. log_event() only packs 8 bytes; log_flusher() prints later.
+LOG_FMT = "<IBxH"       # ticks_ms, event, arg
+LOG_SIZE = const(8)
+LOG_FLUSH_MS = 100      # print this long after the event: press work first
+LOG_RETRY_MS = 250      # poll interval while the host isn't reading
+
+EV_BOOT, EV_START, EV_SHOW, EV_STORM, EV_ABORT = 0, 1, 2, 3, 4
+LOG_TEXT = (
+    "One LED Watch for Pico – starting...",
+    "Start time: %02d:%02d %s",     # arg: ampm << 15 | hour << 8 | minute
+    "Show time: %02d:%02d",         # arg: current_time()
+    "Button storm: IRQ off for %d ms",
+    "Display aborted",
+)
+
+log_ring = bytearray(LOG_RECORDS * LOG_SIZE)
+log_head = 0            # records written
+log_tail = 0            # records printed (or lost)
+log_flag = Flag()       # set when there is work for the flusher
+
+serial = uselect.poll()
+serial.register(sys.stdout, uselect.POLLOUT)
+
+def log_event(event, arg=0):
+    """Append a record; when the ring is full the oldest unprinted one
+    is overwritten. Never blocks. Call from tasks, not IRQs."""
+    global log_head, log_tail
+    if log_head - log_tail == LOG_RECORDS:
+        log_tail += 1
+        stats["log_lost"] += 1
+    ustruct.pack_into(LOG_FMT, log_ring, log_head % LOG_RECORDS * LOG_SIZE,
+                      utime.ticks_ms(), event, arg)
+    log_head += 1
+    if not on_battery:
+        log_flag.set()
+
+def log_text(n):
+    """Record n as a line, "[s.ms] text" (allocates: flusher only)."""
+    t, event, arg = ustruct.unpack_from(LOG_FMT, log_ring,
+                                        n % LOG_RECORDS * LOG_SIZE)
+    text = LOG_TEXT[event]
+    if event == EV_START:
+        text = text % (arg >> 8 & 127, arg & 255, "PM" if arg >> 15 else "AM")
+    elif event == EV_SHOW:
+        text = text % (arg >> 8 & 127, arg & 255)
+    elif event == EV_STORM:
+        text = text % arg
+    return "[%d.%03d] %s" % (t // 1000, t % 1000, text)
+
+async def log_flusher():
+    """Print records once the link takes them: a stalled host leaves them
+    in the ring instead of blocking. On battery they wait there until
+    USB power returns (or are overwritten)."""
+    global log_tail
+    while True:
+        await log_flag.wait()
+        await asyncio.sleep_ms(LOG_FLUSH_MS)
+        while log_tail != log_head and not on_battery:
+            if not serial.poll(0):
+                await asyncio.sleep_ms(LOG_RETRY_MS)
+                continue
+            print(log_text(log_tail))
+            log_tail += 1
+
+# ------------------------------------------------------------
+# Power source: USB (VBUS on GP24) or battery
+# ------------------------------------------------------------
+# RP2040 registers (datasheet 2.15 clocks, 2.18 PLL)
+CLOCKS_BASE = 0x40008000
+CLK_USB_CTRL = CLOCKS_BASE + 0x54
+CLK_RTC_CTRL = CLOCKS_BASE + 0x6c
+CLK_RTC_DIV = CLOCKS_BASE + 0x70
+CLK_ENABLE = 1 << 11
+PLL_USB_CS = 0x4002c000
+PLL_USB_PWR = 0x4002c004
+PLL_LOCK = 1 << 31
+PLL_OFF = 0x2d          # PD | DSMPD | POSTDIVPD | VCOPD
+
+on_battery = False
+
+def rtc_to_xosc():
+    """clk_rtc boots from PLL_USB / 1024: move it to XOSC / 256, the same
+    46875 Hz, so the RTC keeps counting without PLL_USB."""
+    if mem32[CLK_RTC_CTRL] >> 5 & 7 == 3:      # AUXSRC already xosc_clksrc
+        return
+    mem32[CLK_RTC_CTRL] &= ~CLK_ENABLE
+    utime.sleep_us(100)                         # 2 cycles of clk_rtc to stop
+    mem32[CLK_RTC_CTRL] = mem32[CLK_RTC_CTRL] & ~(7 << 5) | 3 << 5
+    mem32[CLK_RTC_DIV] = 256 << 8
+    mem32[CLK_RTC_CTRL] |= CLK_ENABLE
+
+def usb_clocks(on):
+    """Power PLL_USB and clk_usb up or down (clk_rtc moved off it first)."""
+    if on:
+        mem32[PLL_USB_PWR] = 0
+        while not mem32[PLL_USB_CS] & PLL_LOCK:
+            pass
+        mem32[CLK_USB_CTRL] |= CLK_ENABLE
+    else:
+        rtc_to_xosc()
+        mem32[CLK_USB_CTRL] &= ~CLK_ENABLE
+        mem32[PLL_USB_PWR] = PLL_OFF
+
+def power_source(pin=None):
+    """Follow VBUS: at boot and on every change (pin IRQ)."""
+    global on_battery
+    battery = not vbus.value()
+    if battery == on_battery:
+        return
+    on_battery = battery
+    usb_clocks(not battery)     # back on USB the host enumerates it anew
+    if battery:
+        power_flag.set()        # power_manager() may sleep from now on
+    else:
+        log_flag.set()          # print what was logged on battery
+
+vbus = Pin(VBUS_PIN, Pin.IN)
+vbus.irq(trigger=Pin.IRQ_RISING | Pin.IRQ_FALLING, handler=power_source)
+power_source()
+
 # ------------------------------------------------------------
 # Push Button
 # ------------------------------------------------------------
+# Last edge seen by the IRQ (debounce decision is made in main())
+edge_ms = 0
+edge_level = 1
+
+# IRQ rate cap: edges in the current 1 sec window
+window_ms = 0
+window_edges = 0
+storm = False
+
+# Accepted press not released yet: its bounces (and the release) are
+# not new presses. The IRQ also fires on rising edges meanwhile.
+held = False
+
 def button_handler(pin):
-    global button_pressed
-    # Debounce: slow delay and control
-    utime.sleep_ms(20)
-    if pin.value() == 0:
-        button_pressed = True
+    # IRQ: only timestamp the edge, never block here
+    global edge_ms, edge_level, window_ms, window_edges, storm
+    t0 = utime.ticks_us()
+    now = utime.ticks_ms()
+    stats["raw_edges"] += 1
+    set_power(ACTIVE)
+    
+    # Too many edges this second: stop IRQ, main() rearms after holdoff
+    if utime.ticks_diff(now, window_ms) >= 1000:
+        window_ms = now
+        window_edges = 0
+    window_edges += 1
+    if window_edges > IRQ_RATE_CAP:
+        pin.irq(handler=None)
+        storm = True
+        stats["storms"] += 1
+    
+    # Coalesce: edge close to the previous one only moves the timestamp
+    if utime.ticks_diff(now, edge_ms) < COALESCE_MS:
+        stats["dropped"] += 1
+    else:
+        press_flag.set()
+    edge_ms = now
+    edge_level = pin.value()
+    if storm:
+        press_flag.set()
+    
+    dt = utime.ticks_diff(utime.ticks_us(), t0)
+    if dt > stats["isr_max_us"]:
+        stats["isr_max_us"] = dt
+
+def arm_button():
+    global storm
+    storm = False
+    trigger = Pin.IRQ_FALLING
+    if held:
+        trigger |= Pin.IRQ_RISING
+    button.irq(trigger=trigger, handler=button_handler)
+
+# ------------------------------------------------------------
+# PIO button debouncer (BUTTON_FRONTEND = "pio")
+# ------------------------------------------------------------
+if BUTTON_FRONTEND == "pio":
+    import rp2
+
+    # Button must stay low for 32 loops of 3 cycles after a falling
+    # edge, else start over. Clean press -> irq, then wait for release.
+    @rp2.asm_pio()
+    def pio_debounce():
+        wrap_target()
+        label("start")
+        wait(1, pin, 0)
+        wait(0, pin, 0)
+        set(x, 31)
+        label("hold")
+        jmp(pin, "start")
+        jmp(x_dec, "hold")  [1]
+        irq(rel(0))
+        wrap()
 
-button.irq(trigger=Pin.IRQ_FALLING, handler=button_handler)
+    def pio_handler(sm):
+        # Already debounced: backdate edge so main() accepts at once
+        global edge_ms, edge_level
+        stats["raw_edges"] += 1
+        edge_ms = utime.ticks_add(utime.ticks_ms(), -DEBOUNCE_MS)
+        edge_level = 0
+        press_flag.set()
+
+    def button_sm_init():
+        """(Re)start the debouncer; its clock divider follows clk_sys."""
+        button_sm.init(pio_debounce, freq=96_000 // DEBOUNCE_MS,
+                       in_base=button, jmp_pin=button)
+        button_sm.active(1)
+
+    button_sm = rp2.StateMachine(PIO_SM_BUTTON)
+    button_sm.irq(pio_handler)
+    button_sm_init()
+else:
+    arm_button()
 
 # ------------------------------------------------------------
-# Timer 1sec 
+# Timer 1sec (or 1 per minute boundary in "minute" mode)
 # ------------------------------------------------------------
 timer = Timer()
 
+# Time of day as one counter: seconds since midnight (0–86399).
+# A single int, so reading it is atomic against tick().
+day_seconds = (hour % 12 + 12 * ampm) * 3600 + minute * 60 + second
+
+# ticks_ms of the last counted second. Soft timer callbacks can come
+# late or be merged when the scheduler is busy, so tick() counts the
+# whole seconds elapsed since then instead of 1 per call.
+tick_ms = utime.ticks_ms()
+
 def tick(t):
-    global second, minute, hour, ampm, time_updated
-    second += 1
-    if second >= 60:
-        second = 0
-        minute += 1
-        if minute >= 60:
-            minute = 0
-            old_hour = hour
-            hour += 1
-            if hour > 12:
-                hour = 1
-            # change AM/PM from 11 to 12
-            if old_hour == 11 and hour == 12:
-                ampm = not ampm
+    global day_seconds, time_updated, tick_ms
+    n = (utime.ticks_diff(utime.ticks_ms(), tick_ms) + 500) // 1000
+    due = 60 - day_seconds % 60 if CLOCK_MODE == "minute" else 1
+    if n > due:
+        stats["catchups"] += 1
+    tick_ms = utime.ticks_add(tick_ms, n * 1000)
+    day_seconds = (day_seconds + n) % 86400
     time_updated = True
+    if CLOCK_MODE == "minute":
+        arm_minute()
 
-# Start timer every 1000ms (1sec)
-timer.init(period=1000, mode=Timer.PERIODIC, callback=tick)
+def arm_minute():
+    """One-shot alarm at the next minute boundary of the counted time."""
+    timer.init(period=clock_deadline_ms(), mode=Timer.ONE_SHOT,
+               callback=tick)
+
+def clock_deadline_ms():
+    """ms until the next tick()/alarm is due, SLEEP_MAX_MS without one."""
+    late = utime.ticks_diff(utime.ticks_ms(), tick_ms)
+    if CLOCK_MODE == "tick":
+        return (999 - late) % 1000 + 1
+    if CLOCK_MODE == "minute":      # next boundary, also if one was missed
+        return ((60 - day_seconds % 60) * 1000 - late - 1) % 60_000 + 1
+    return SLEEP_MAX_MS
+
+def minute_seconds():
+    """day_seconds plus the whole seconds since the last alarm."""
+    while True:
+        s, t0 = day_seconds, tick_ms
+        if s == day_seconds:    # no alarm in between
+            break
+    return (s + max(0, utime.ticks_diff(utime.ticks_ms(), t0)) // 1000) \
+        % 86400
+
+# Start timer every 1000ms (1sec), or at the next minute boundary
+tick_ms = utime.ticks_ms()
+if CLOCK_MODE == "tick":
+    timer.init(period=1000, mode=Timer.PERIODIC, callback=tick)
+elif CLOCK_MODE == "minute":
+    arm_minute()
+
+# ------------------------------------------------------------
+# Tickless time: start time + elapsed ticks_ms
+# ------------------------------------------------------------
+# Start time stored once as seconds of day
+_anchor_s = day_seconds
+_anchor_ms = utime.ticks_ms()
+
+def tickless_seconds():
+    """Fold elapsed whole seconds into the anchor, return seconds of day."""
+    global _anchor_s, _anchor_ms
+    elapsed = utime.ticks_diff(utime.ticks_ms(), _anchor_ms) // 1000
+    _anchor_ms = utime.ticks_add(_anchor_ms, elapsed * 1000)
+    _anchor_s = (_anchor_s + elapsed) % 86400
+    return _anchor_s
+
+# ------------------------------------------------------------
+# RTC time: seeded once from start time, hardware keeps counting
+# ------------------------------------------------------------
+def rtc_seed(s):
+    """Set RTC to seconds of day s (date is arbitrary: Mon 2024-01-01)."""
+    h24, rem = divmod(s, 3600)
+    rtc.datetime((2024, 1, 1, 0, h24, rem // 60, rem % 60, 0))
+
+RTC_0 = 0x4005c01c      # RTC register: DOTW, HOUR, MIN, SEC fields
+
+def rtc_seconds():
+    """Read RTC, return seconds of day. Straight from the register:
+    rtc.datetime() would allocate a tuple per read."""
+    r = mem32[RTC_0]
+    return (r >> 16 & 31) * 3600 + (r >> 8 & 63) * 60 + (r & 63)
+
+if CLOCK_MODE == "rtc":
+    rtc_seed(day_seconds)
+
+def clock_seconds():
+    """Current seconds of day for the selected clock mode."""
+    if CLOCK_MODE == "rtc":
+        return rtc_seconds()
+    if CLOCK_MODE == "tickless":
+        return tickless_seconds()
+    if CLOCK_MODE == "minute":
+        return minute_seconds()
+    return day_seconds
+
+def current_time():
+    """Current time as ampm << 15 | hour (1–12) << 8 | minute: one small
+    int, so a press allocates nothing to read it."""
+    s = clock_seconds()
+    return s // 43200 << 15 | (s // 3600 % 12 or 12) << 8 | s // 60 % 60
+
+def clock_set(s):
+    """Restart the selected clock at seconds of day s."""
+    global day_seconds, tick_ms, _anchor_s, _anchor_ms
+    day_seconds = _anchor_s = s
+    tick_ms = _anchor_ms = utime.ticks_ms()
+    if CLOCK_MODE == "rtc":
+        rtc_seed(s)
+    elif CLOCK_MODE == "tick":
+        timer.init(period=1000, mode=Timer.PERIODIC, callback=tick)
+    elif CLOCK_MODE == "minute":
+        arm_minute()
+
+# True after a dormant nobody could time: shown with a warning flicker
+time_uncertain = False
+
+def set_time(h, m, ampm=0):
+    """Set the clock from the REPL (h 1–12), clears time_uncertain."""
+    global time_uncertain
+    clock_set((h % 12 + 12 * ampm) * 3600 + m * 60)
+    time_uncertain = False
+
+async def reanchor():
+    """ticks_diff() is only valid for ~6 days: fold elapsed time once a day."""
+    while True:
+        await asyncio.sleep(86400)
+        tickless_seconds()
 
 # ------------------------------------------------------------
 # Show time with LED
 # ------------------------------------------------------------
-async def display_time(h, m):
-    """Shows time with LED pulses."""
-    
-    # 1) Hour: h pulses 1000ms
-    if h > 0:
-        await flash_group(h, 1000, 500)
-        await asyncio.sleep(1)      # pause 1sec
-    
-    # 2) Quarters: m/15 pulses 500ms
-    quarters = m // 15
-    if quarters > 0:
-        await flash_group(quarters, 500, 500)
-        await asyncio.sleep(1)      # pause 1sec
-    
-    # 3) Minutes mod 15: m%15 pulses 250ms
-    minutes_mod = m % 15
-    if minutes_mod > 0:
-        await flash_group(minutes_mod, 250, 500)
-    # NO final pause
-
-async def flash_group(count, on_time, off_time):
-    """Blinks LED 'count' times with duration on/off."""
-    for i in range(count):
-        led.value(1)
-        await asyncio.sleep_ms(on_time)
+# Pulse schedules for all 12 x 60 times, see tools/gen_pulse_table.py.
+# Another ENCODER than the frozen table's is built into RAM at boot.
+import pulse_table
+if pulse_table.ENCODER == ENCODER:
+    INDEX, TABLE, UNIT_MS = pulse_table.INDEX, pulse_table.TABLE, pulse_table.UNIT_MS
+else:
+    import encoders
+    INDEX, TABLE = encoders.build(ENCODER)
+    UNIT_MS = encoders.UNIT_MS
+
+def offset(e):
+    """Byte offset in TABLE of entry e: the schedule for h:m is
+    [offset(e), offset(e + 1)) with e = (h - 1) * 60 + m."""
+    return INDEX[2 * e] | INDEX[2 * e + 1] << 8
+
+# Played before the time while time_uncertain: 3 short flashes, pause
+UNCERTAIN = b"\x11\x11\x14"
+
+def nibble(j, table=TABLE):
+    """Run length j of table in UNIT_MS (0 = end), high nibble first."""
+    b = table[j >> 1]
+    return b & 15 if j & 1 else b >> 4
+
+# ticks_ms of the next LED edge, for power_manager() (DISPLAY_SLEEP)
+edge_due = utime.ticks_ms()
+
+# ------------------------------------------------------------
+# PIO LED sequencer (DISPLAY_BACKEND = "pio")
+# ------------------------------------------------------------
+if DISPLAY_BACKEND == "pio":
+    import rp2
+    from array import array
+
+    # One 32 bit word per run: bit 0 LED level, bit 1 last run (raise
+    # irq when done), bits 2–31 length in delay loops. 6 cycles of
+    # overhead between two out(pins) edges.
+    @rp2.asm_pio(out_init=rp2.PIO.OUT_LOW, out_shiftdir=rp2.PIO.SHIFT_RIGHT)
+    def pio_pulses():
+        wrap_target()
+        label("next")
+        pull(block)
+        out(pins, 1)
+        out(y, 1)
+        out(x, 30)
+        label("delay")
+        jmp(x_dec, "delay")
+        jmp(not_y, "next")
+        irq(rel(0))
+        wrap()
+
+    pulses_done = Flag()
+    led_sm = rp2.StateMachine(PIO_SM_LED, pio_pulses, freq=PIO_LED_FREQ,
+                              out_base=led)
+    led_sm.irq(lambda sm: pulses_done.set())
+    led_sm.active(1)
+
+    # DMA feeds the TX FIFO of PIO_SM_LED, paced by its DREQ
+    pio_words = array("I", [0] * 64)     # longest schedule: 58 runs + end
+    led_dma = rp2.DMA()
+    LED_TXF = 0x50200010 + (PIO_SM_LED // 4) * 0x100000 + (PIO_SM_LED % 4) * 4
+    LED_DREQ = (PIO_SM_LED // 4) * 8 + PIO_SM_LED % 4
+    LED_CTRL = led_dma.pack_ctrl(size=2, inc_write=False, treq_sel=LED_DREQ)
+
+def pio_start(table, start, end):
+    """Hand runs of table to the PIO sequencer (done IRQ -> pulses_done)."""
+    n = 0
+    level = 1
+    j = 2 * start
+    while j < 2 * end:
+        units = nibble(j, table)
+        if not units:
+            break
+        cycles = units * UNIT_MS * PIO_LED_FREQ // 1000
+        pio_words[n] = max(0, cycles - 6) << 2 | level
+        level ^= 1
+        n += 1
+        j += 1
+    pio_words[n] = 0b10             # end: LED off, raise irq
+    pulses_done.clear()
+    led_dma.config(read=pio_words, write=LED_TXF, count=n + 1,
+                   ctrl=LED_CTRL, trigger=True)
+
+def led_off():
+    """Stop any pulse output and force the LED off."""
+    if DISPLAY_BACKEND == "pio":
+        # Drop queued words: stop DMA, re-init SM (clears FIFOs, pin low)
+        led_dma.active(0)
+        led_sm.active(0)
+        led_sm.init(pio_pulses, freq=PIO_LED_FREQ, out_base=led)
+        led_sm.active(1)
+    else:
         led.value(0)
-        if i < count - 1:
-            await asyncio.sleep_ms(off_time)
+
+# ------------------------------------------------------------
+# Clock governor
+# ------------------------------------------------------------
+def set_freq(hz):
+    """Switch clk_sys to hz, then re-derive what is clocked from it.
+
+    PIO clock dividers are computed from clk_sys by init(), so the state
+    machines are restarted. Timer and ticks_ms() count the 1 MHz TIMER
+    tick (from clk_ref) and USB runs from PLL_USB, so they keep going.
+    No UART is used; one would need init(baudrate=...) again here.
+    """
+    if not hz or machine.freq() == hz:
+        return
+    machine.freq(hz)
+    if BUTTON_FRONTEND == "pio":
+        button_sm_init()
+    if DISPLAY_BACKEND == "pio":
+        led_off()                   # re-inits led_sm
+
+# ------------------------------------------------------------
+# Display task: created once, not per press
+# ------------------------------------------------------------
+show_hm = 0             # current_time() to show
+show_flag = Flag()      # set by main() to start a display
+displaying = False
+
+async def display_loop():
+    """Shows the time with LED pulses each time show_flag is set. The
+    players run inline (a coroutine call would allocate its frame); a
+    cancel aborts the display, not the task. LED always ends off."""
+    global displaying, edge_due
+    while True:
+        try:
+            await show_flag.wait()
+            set_freq(FREQ_DISPLAY)
+            if on_battery:
+                usb_clocks(False)   # back on after a lightsleep
+            set_power(DISPLAY)
+            e = ((show_hm >> 8 & 127) - 1) * 60 + (show_hm & 255)
+            span = 0 if time_uncertain else 1
+            while span < 2:
+                if span:
+                    table, start, end = TABLE, offset(e), offset(e + 1)
+                else:
+                    table, start, end = UNCERTAIN, 0, len(UNCERTAIN)
+                span += 1
+                if DISPLAY_BACKEND == "pio":
+                    pio_start(table, start, end)
+                    await pulses_done.wait()
+                    continue
+                # Runs of table: ON, OFF, ON, ... for their lengths
+                level = 1
+                deadline = utime.ticks_ms()
+                j = 2 * start
+                while j < 2 * end:
+                    units = nibble(j, table)
+                    if not units:
+                        break
+                    led.value(level)
+                    if PULSE_TIMING == "deadline":
+                        # Late wakeup shortens the next wait instead of
+                        # shifting all edges
+                        deadline = utime.ticks_add(deadline, units * UNIT_MS)
+                        edge_due = deadline
+                        await asyncio.sleep_ms(max(0, utime.ticks_diff(
+                            deadline, utime.ticks_ms())))
+                    else:
+                        edge_due = utime.ticks_add(utime.ticks_ms(),
+                                                   units * UNIT_MS)
+                        await asyncio.sleep_ms(units * UNIT_MS)
+                    level ^= 1
+                    j += 1
+                led.value(0)
+        except asyncio.CancelledError:
+            show_flag.clear()       # aborted, maybe before it started
+        finally:
+            led_off()
+            set_freq(FREQ_IDLE)
+            if power_state == DISPLAY:
+                set_power(IDLE)
+            displaying = False
+        if LOG_DEBUG:
+            micropython.mem_info()  # "used" grows by IOQueue entries only
+
+# ------------------------------------------------------------
+# Power manager: lightsleep while IDLE, dormant when left alone
+# ------------------------------------------------------------
+last_press_ms = utime.ticks_ms()     # last button activity, for DORMANT_AFTER_MIN
+
+async def power_manager():
+    """Sleep until a button edge or the next clock deadline, again and
+    again while IDLE. The TIMER keeps counting in lightsleep; alarms due
+    meanwhile run on wake and tick() catches up the seconds.
+
+    With DISPLAY_SLEEP the CPU player's waits are slept through as well:
+    this task only gets the CPU once the player is parked on its next
+    edge, and sleeps no further than that edge.
+
+    On USB power it stays awake: USB serial does not survive lightsleep."""
+    display_sleep = DISPLAY_SLEEP and DISPLAY_BACKEND == "cpu"
+    while True:
+        await power_flag.wait()
+        while power_state == DISPLAY and display_sleep and on_battery:
+            ms = min(utime.ticks_diff(edge_due, utime.ticks_ms()),
+                     clock_deadline_ms())
+            if ms > 0:
+                lightsleep_from(DISPLAY, ms)
+            await asyncio.sleep_ms(0)   # player's edge runs first
+        while power_state == IDLE and on_battery:
+            ms = clock_deadline_ms()
+            if DORMANT_AFTER_MIN:
+                left = DORMANT_AFTER_MIN * 60_000 \
+                    - utime.ticks_diff(utime.ticks_ms(), last_press_ms)
+                if left <= 0:
+                    dormant()
+                    await asyncio.sleep_ms(0)
+                    continue
+                ms = min(ms, left)
+            lightsleep_from(IDLE, ms)
+            await asyncio.sleep_ms(0)   # let the wake IRQ/alarm run
+        after_wake()                    # staying awake: press, USB power
+
+def lightsleep_from(state, ms):
+    """lightsleep(ms) unless a button IRQ left state since the caller
+    checked. IRQs are off from the check to the sleep: an edge meanwhile
+    stays pending, ends the sleep at once and runs at enable_irq()."""
+    irq = machine.disable_irq()
+    if power_state == state:
+        set_power(SLEEP)
+        machine.lightsleep(ms)
+        set_power(state)
+    machine.enable_irq(irq)
+
+def after_wake():
+    """rp2's lightsleep() re-runs clocks_init() on wake: clk_sys at
+    125 MHz, PLL_USB and clk_usb on, clk_rtc on PLL_USB. A wake that
+    only ticks the clock or plays an LED edge sleeps again within a task
+    step, faster at 125 MHz than a freq() switch (PLL_SYS relock) there
+    and back. Once power_manager() stops sleeping, redo the governor's
+    frequency. PLL_USB may run until the next sleep stops it again
+    (cheaper than the clk_rtc switch); display_loop() shuts it down for
+    a display on battery, the one long time awake."""
+    set_freq(FREQ_DISPLAY if power_state == DISPLAY else FREQ_IDLE)
+
+def dormant():
+    """Dormant until a button edge. TIMER, Timer alarms and the RTC stop
+    with the crystal, so the clock restarts where it stopped and the
+    time is marked uncertain. IRQs are off throughout, as in
+    lightsleep_from()."""
+    global time_uncertain
+    irq = machine.disable_irq()
+    if power_state != IDLE:
+        machine.enable_irq(irq)
+        return
+    s = clock_seconds()
+    timer.deinit()
+    set_power(DORMANT)
+    machine.lightsleep()            # no timeout: XOSC dormant, GPIO wake
+    set_power(IDLE)
+    time_uncertain = True
+    clock_set(s)
+    machine.enable_irq(irq)
 
 # ------------------------------------------------------------
 # Main asyncio function
 # ------------------------------------------------------------
 async def main():
-    global button_pressed, time_updated, hour, minute
+    global last_press_ms, show_hm, displaying, held
+    if LOG_INFO:
+        log_event(EV_BOOT)
+        log_event(EV_START, ampm << 15 | hour << 8 | minute)
     
-    print("One LED Watch for Pico – starting...")
-    print(f"Start time: {hour:02d}:{minute:02d} {'PM' if ampm else 'AM'}")
+    set_freq(FREQ_IDLE)
+    asyncio.create_task(log_flusher())
+    if CLOCK_MODE == "tickless":
+        asyncio.create_task(reanchor())
+    if POWER_MODE == "lightsleep" and BUTTON_FRONTEND == "irq":
+        asyncio.create_task(power_manager())
+    display = asyncio.create_task(display_loop())
+    gc.collect()        # boot garbage; below only flag waits allocate
     
     while True:
-        # Check button
-        if button_pressed:
-            button_pressed = False
-            
-            # Disable button stop temporarily
-            button.irq(handler=None)
-            
-            # Show current time
-            cur_hour = hour
-            cur_minute = minute
-            print(f"Show time: {cur_hour:02d}:{cur_minute:02d}")
-            await display_time(cur_hour, cur_minute)
-            
-            # Debounce: wait button release
-            while button.value() == 0:
-                await asyncio.sleep_ms(10)
-            await asyncio.sleep_ms(50)
-            
-            # Enable button stop
-            button.irq(trigger=Pin.IRQ_FALLING, handler=button_handler)
+        set_power(DISPLAY if displaying else IDLE)
+        # Sleep until button IRQ sets the flag (no polling)
+        await press_flag.wait()
+        set_power(ACTIVE)
+        last_press_ms = utime.ticks_ms()
+        stats["wakeups"] += 1
+        
+        # IRQ storm: let the contact settle, then listen again
+        if storm:
+            if LOG_DEBUG:
+                log_event(EV_STORM, STORM_HOLDOFF_MS)
+            await asyncio.sleep_ms(STORM_HOLDOFF_MS)
+            press_flag.clear()
+            if held and button.value():
+                held = False                # released while IRQ was off
+            arm_button()
+            continue
+        
+        # Debounce: accept only if button still down after quiet time
+        while True:
+            quiet = utime.ticks_diff(utime.ticks_ms(), edge_ms)
+            if quiet >= DEBOUNCE_MS:
+                break
+            await asyncio.sleep_ms(DEBOUNCE_MS - quiet)
+        if held:
+            if storm or not edge_level or not button.value():
+                stats["rejected"] += 1      # bounce of the held press
+                continue
+            held = False                    # debounced release
+            arm_button()
+            continue
+        if storm or edge_level or button.value():
+            stats["rejected"] += 1
+            continue
+        if BUTTON_FRONTEND == "irq":
+            held = True                     # one action per press
+            arm_button()
+        
+        # Second press during a display: abort it
+        if displaying:
+            display.cancel()
+            stats["aborts"] += 1
+            if LOG_DEBUG:
+                log_event(EV_ABORT)
+            continue
+        stats["presses"] += 1
         
-        # Slow delay for energy save
-        await asyncio.sleep_ms(100)
+        # Show current time (button IRQ stays live meanwhile)
+        show_hm = current_time()
+        if LOG_INFO:
+            log_event(EV_SHOW, show_hm)
+        displaying = True
+        show_flag.set()
 
 # ------------------------------------------------------------
 # Start
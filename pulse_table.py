@@ -0,0 +1,522 @@
+# Generated by tools/gen_pulse_table.py - do not edit.
+# LED schedules for all 12 x 60 times, see the generator for the format.
+
+ENCODER = 'classic'
+UNIT_MS = 250
+
+INDEX = (
+    b"\x00\x00\x01\x00\x03\x00\x06\x00\x0a\x00\x0f\x00\x15\x00\x1c\x00\x24\x00\x2d\x00\x37\x00\x42\x00"
+    b"\x4e\x00\x5b\x00\x69\x00\x78\x00\x7a\x00\x7d\x00\x81\x00\x86\x00\x8c\x00\x93\x00\x9b\x00\xa4\x00"
+    b"\xae\x00\xb9\x00\xc5\x00\xd2\x00\xe0\x00\xef\x00\xff\x00\x02\x01\x06\x01\x0b\x01\x11\x01\x18\x01"
+    b"\x20\x01\x29\x01\x33\x01\x3e\x01\x4a\x01\x57\x01\x65\x01\x74\x01\x84\x01\x95\x01\x99\x01\x9e\x01"
+    b"\xa4\x01\xab\x01\xb3\x01\xbc\x01\xc6\x01\xd1\x01\xdd\x01\xea\x01\xf8\x01\x07\x02\x17\x02\x28\x02"
+    b"\x3a\x02\x3c\x02\x3f\x02\x43\x02\x48\x02\x4e\x02\x55\x02\x5d\x02\x66\x02\x70\x02\x7b\x02\x87\x02"
+    b"\x94\x02\xa2\x02\xb1\x02\xc1\x02\xc4\x02\xc8\x02\xcd\x02\xd3\x02\xda\x02\xe2\x02\xeb\x02\xf5\x02"
+    b"\x00\x03\x0c\x03\x19\x03\x27\x03\x36\x03\x46\x03\x57\x03\x5b\x03\x60\x03\x66\x03\x6d\x03\x75\x03"
+    b"\x7e\x03\x88\x03\x93\x03\x9f\x03\xac\x03\xba\x03\xc9\x03\xd9\x03\xea\x03\xfc\x03\x01\x04\x07\x04"
+    b"\x0e\x04\x16\x04\x1f\x04\x29\x04\x34\x04\x40\x04\x4d\x04\x5b\x04\x6a\x04\x7a\x04\x8b\x04\x9d\x04"
+    b"\xb0\x04\xb3\x04\xb7\x04\xbc\x04\xc2\x04\xc9\x04\xd1\x04\xda\x04\xe4\x04\xef\x04\xfb\x04\x08\x05"
+    b"\x16\x05\x25\x05\x35\x05\x46\x05\x4a\x05\x4f\x05\x55\x05\x5c\x05\x64\x05\x6d\x05\x77\x05\x82\x05"
+    b"\x8e\x05\x9b\x05\xa9\x05\xb8\x05\xc8\x05\xd9\x05\xeb\x05\xf0\x05\xf6\x05\xfd\x05\x05\x06\x0e\x06"
+    b"\x18\x06\x23\x06\x2f\x06\x3c\x06\x4a\x06\x59\x06\x69\x06\x7a\x06\x8c\x06\x9f\x06\xa5\x06\xac\x06"
+    b"\xb4\x06\xbd\x06\xc7\x06\xd2\x06\xde\x06\xeb\x06\xf9\x06\x08\x07\x18\x07\x29\x07\x3b\x07\x4e\x07"
+    b"\x62\x07\x66\x07\x6b\x07\x71\x07\x78\x07\x80\x07\x89\x07\x93\x07\x9e\x07\xaa\x07\xb7\x07\xc5\x07"
+    b"\xd4\x07\xe4\x07\xf5\x07\x07\x08\x0c\x08\x12\x08\x19\x08\x21\x08\x2a\x08\x34\x08\x3f\x08\x4b\x08"
+    b"\x58\x08\x66\x08\x75\x08\x85\x08\x96\x08\xa8\x08\xbb\x08\xc1\x08\xc8\x08\xd0\x08\xd9\x08\xe3\x08"
+    b"\xee\x08\xfa\x08\x07\x09\x15\x09\x24\x09\x34\x09\x45\x09\x57\x09\x6a\x09\x7e\x09\x85\x09\x8d\x09"
+    b"\x96\x09\xa0\x09\xab\x09\xb7\x09\xc4\x09\xd2\x09\xe1\x09\xf1\x09\x02\x0a\x14\x0a\x27\x0a\x3b\x0a"
+    b"\x50\x0a\x55\x0a\x5b\x0a\x62\x0a\x6a\x0a\x73\x0a\x7d\x0a\x88\x0a\x94\x0a\xa1\x0a\xaf\x0a\xbe\x0a"
+    b"\xce\x0a\xdf\x0a\xf1\x0a\x04\x0b\x0a\x0b\x11\x0b\x19\x0b\x22\x0b\x2c\x0b\x37\x0b\x43\x0b\x50\x0b"
+    b"\x5e\x0b\x6d\x0b\x7d\x0b\x8e\x0b\xa0\x0b\xb3\x0b\xc7\x0b\xce\x0b\xd6\x0b\xdf\x0b\xe9\x0b\xf4\x0b"
+    b"\x00\x0c\x0d\x0c\x1b\x0c\x2a\x0c\x3a\x0c\x4b\x0c\x5d\x0c\x70\x0c\x84\x0c\x99\x0c\xa1\x0c\xaa\x0c"
+    b"\xb4\x0c\xbf\x0c\xcb\x0c\xd8\x0c\xe6\x0c\xf5\x0c\x05\x0d\x16\x0d\x28\x0d\x3b\x0d\x4f\x0d\x64\x0d"
+    b"\x7a\x0d\x80\x0d\x87\x0d\x8f\x0d\x98\x0d\xa2\x0d\xad\x0d\xb9\x0d\xc6\x0d\xd4\x0d\xe3\x0d\xf3\x0d"
+    b"\x04\x0e\x16\x0e\x29\x0e\x3d\x0e\x44\x0e\x4c\x0e\x55\x0e\x5f\x0e\x6a\x0e\x76\x0e\x83\x0e\x91\x0e"
+    b"\xa0\x0e\xb0\x0e\xc1\x0e\xd3\x0e\xe6\x0e\xfa\x0e\x0f\x0f\x17\x0f\x20\x0f\x2a\x0f\x35\x0f\x41\x0f"
+    b"\x4e\x0f\x5c\x0f\x6b\x0f\x7b\x0f\x8c\x0f\x9e\x0f\xb1\x0f\xc5\x0f\xda\x0f\xf0\x0f\xf9\x0f\x03\x10"
+    b"\x0e\x10\x1a\x10\x27\x10\x35\x10\x44\x10\x54\x10\x65\x10\x77\x10\x8a\x10\x9e\x10\xb3\x10\xc9\x10"
+    b"\xe0\x10\xe7\x10\xef\x10\xf8\x10\x02\x11\x0d\x11\x19\x11\x26\x11\x34\x11\x43\x11\x53\x11\x64\x11"
+    b"\x76\x11\x89\x11\x9d\x11\xb2\x11\xba\x11\xc3\x11\xcd\x11\xd8\x11\xe4\x11\xf1\x11\xff\x11\x0e\x12"
+    b"\x1e\x12\x2f\x12\x41\x12\x54\x12\x68\x12\x7d\x12\x93\x12\x9c\x12\xa6\x12\xb1\x12\xbd\x12\xca\x12"
+    b"\xd8\x12\xe7\x12\xf7\x12\x08\x13\x1a\x13\x2d\x13\x41\x13\x56\x13\x6c\x13\x83\x13\x8d\x13\x98\x13"
+    b"\xa4\x13\xb1\x13\xbf\x13\xce\x13\xde\x13\xef\x13\x01\x14\x14\x14\x28\x14\x3d\x14\x53\x14\x6a\x14"
+    b"\x82\x14\x8a\x14\x93\x14\x9d\x14\xa8\x14\xb4\x14\xc1\x14\xcf\x14\xde\x14\xee\x14\xff\x14\x11\x15"
+    b"\x24\x15\x38\x15\x4d\x15\x63\x15\x6c\x15\x76\x15\x81\x15\x8d\x15\x9a\x15\xa8\x15\xb7\x15\xc7\x15"
+    b"\xd8\x15\xea\x15\xfd\x15\x11\x16\x26\x16\x3c\x16\x53\x16\x5d\x16\x68\x16\x74\x16\x81\x16\x8f\x16"
+    b"\x9e\x16\xae\x16\xbf\x16\xd1\x16\xe4\x16\xf8\x16\x0d\x17\x23\x17\x3a\x17\x52\x17\x5d\x17\x69\x17"
+    b"\x76\x17\x84\x17\x93\x17\xa3\x17\xb4\x17\xc6\x17\xd9\x17\xed\x17\x02\x18\x18\x18\x2f\x18\x47\x18"
+    b"\x60\x18\x69\x18\x73\x18\x7e\x18\x8a\x18\x97\x18\xa5\x18\xb4\x18\xc4\x18\xd5\x18\xe7\x18\xfa\x18"
+    b"\x0e\x19\x23\x19\x39\x19\x50\x19\x5a\x19\x65\x19\x71\x19\x7e\x19\x8c\x19\x9b\x19\xab\x19\xbc\x19"
+    b"\xce\x19\xe1\x19\xf5\x19\x0a\x1a\x20\x1a\x37\x1a\x4f\x1a\x5a\x1a\x66\x1a\x73\x1a\x81\x1a\x90\x1a"
+    b"\xa0\x1a\xb1\x1a\xc3\x1a\xd6\x1a\xea\x1a\xff\x1a\x15\x1b\x2c\x1b\x44\x1b\x5d\x1b\x69\x1b\x76\x1b"
+    b"\x84\x1b\x93\x1b\xa3\x1b\xb4\x1b\xc6\x1b\xd9\x1b\xed\x1b\x02\x1c\x18\x1c\x2f\x1c\x47\x1c\x60\x1c"
+    b"\x7a\x1c\x84\x1c\x8f\x1c\x9b\x1c\xa8\x1c\xb6\x1c\xc5\x1c\xd5\x1c\xe6\x1c\xf8\x1c\x0b\x1d\x1f\x1d"
+    b"\x34\x1d\x4a\x1d\x61\x1d\x79\x1d\x84\x1d\x90\x1d\x9d\x1d\xab\x1d\xba\x1d\xca\x1d\xdb\x1d\xed\x1d"
+    b"\x00\x1e\x14\x1e\x29\x1e\x3f\x1e\x56\x1e\x6e\x1e\x87\x1e\x93\x1e\xa0\x1e\xae\x1e\xbd\x1e\xcd\x1e"
+    b"\xde\x1e\xf0\x1e\x03\x1f\x17\x1f\x2c\x1f\x42\x1f\x59\x1f\x71\x1f\x8a\x1f\xa4\x1f\xb1\x1f\xbf\x1f"
+    b"\xce\x1f\xde\x1f\xef\x1f\x01\x20\x14\x20\x28\x20\x3d\x20\x53\x20\x6a\x20\x82\x20\x9b\x20\xb5\x20"
+    b"\xd0\x20\xdb\x20\xe7\x20\xf4\x20\x02\x21\x11\x21\x21\x21\x32\x21\x44\x21\x57\x21\x6b\x21\x80\x21"
+    b"\x96\x21\xad\x21\xc5\x21\xde\x21\xea\x21\xf7\x21\x05\x22\x14\x22\x24\x22\x35\x22\x47\x22\x5a\x22"
+    b"\x6e\x22\x83\x22\x99\x22\xb0\x22\xc8\x22\xe1\x22\xfb\x22\x08\x23\x16\x23\x25\x23\x35\x23\x46\x23"
+    b"\x58\x23\x6b\x23\x7f\x23\x94\x23\xaa\x23\xc1\x23\xd9\x23\xf2\x23\x0c\x24\x27\x24\x35\x24\x44\x24"
+    b"\x54\x24\x65\x24\x77\x24\x8a\x24\x9e\x24\xb3\x24\xc9\x24\xe0\x24\xf8\x24\x11\x25\x2b\x25\x46\x25"
+    b"\x62\x25\x6e\x25\x7b\x25\x89\x25\x98\x25\xa8\x25\xb9\x25\xcb\x25\xde\x25\xf2\x25\x07\x26\x1d\x26"
+    b"\x34\x26\x4c\x26\x65\x26\x7f\x26\x8c\x26\x9a\x26\xa9\x26\xb9\x26\xca\x26\xdc\x26\xef\x26\x03\x27"
+    b"\x18\x27\x2e\x27\x45\x27\x5d\x27\x76\x27\x90\x27\xab\x27\xb9\x27\xc8\x27\xd8\x27\xe9\x27\xfb\x27"
+    b"\x0e\x28\x22\x28\x37\x28\x4d\x28\x64\x28\x7c\x28\x95\x28\xaf\x28\xca\x28\xe6\x28\xf5\x28\x05\x29"
+    b"\x16\x29\x28\x29\x3b\x29\x4f\x29\x64\x29\x7a\x29\x91\x29\xa9\x29\xc2\x29\xdc\x29\xf7\x29\x13\x2a"
+    b"\x30\x2a"
+)
+
+TABLE = (
+    b"\x44\x44\x10\x44\x12\x10\x44\x12\x12\x10\x44\x12\x12\x12\x10\x44\x12\x12\x12\x12\x10\x44\x12\x12"
+    b"\x12\x12\x12\x10\x44\x12\x12\x12\x12\x12\x12\x10\x44\x12\x12\x12\x12\x12\x12\x12\x10\x44\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x10\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x44\x24\x44\x24\x10\x44\x24\x12\x10\x44\x24\x12\x12\x10\x44\x24\x12\x12\x12\x10\x44\x24\x12\x12"
+    b"\x12\x12\x10\x44\x24\x12\x12\x12\x12\x12\x10\x44\x24\x12\x12\x12\x12\x12\x12\x10\x44\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44\x24\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x10\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44\x24\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x10\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44\x22\x24\x44\x22\x24\x10\x44\x22"
+    b"\x24\x12\x10\x44\x22\x24\x12\x12\x10\x44\x22\x24\x12\x12\x12\x10\x44\x22\x24\x12\x12\x12\x12\x10"
+    b"\x44\x22\x24\x12\x12\x12\x12\x12\x10\x44\x22\x24\x12\x12\x12\x12\x12\x12\x10\x44\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44\x22\x24\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x10\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44\x22\x24"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x10\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44\x22\x22"
+    b"\x24\x44\x22\x22\x24\x10\x44\x22\x22\x24\x12\x10\x44\x22\x22\x24\x12\x12\x10\x44\x22\x22\x24\x12"
+    b"\x12\x12\x10\x44\x22\x22\x24\x12\x12\x12\x12\x10\x44\x22\x22\x24\x12\x12\x12\x12\x12\x10\x44\x22"
+    b"\x22\x24\x12\x12\x12\x12\x12\x12\x10\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x44\x22\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x44\x22\x22\x24\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x10\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x42\x44\x10\x42"
+    b"\x44\x12\x10\x42\x44\x12\x12\x10\x42\x44\x12\x12\x12\x10\x42\x44\x12\x12\x12\x12\x10\x42\x44\x12"
+    b"\x12\x12\x12\x12\x10\x42\x44\x12\x12\x12\x12\x12\x12\x10\x42\x44\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42"
+    b"\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x10\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x24\x42\x44\x24\x10\x42\x44\x24\x12\x10\x42\x44\x24"
+    b"\x12\x12\x10\x42\x44\x24\x12\x12\x12\x10\x42\x44\x24\x12\x12\x12\x12\x10\x42\x44\x24\x12\x12\x12"
+    b"\x12\x12\x10\x42\x44\x24\x12\x12\x12\x12\x12\x12\x10\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x10\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x24\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x22\x24\x42\x44\x22\x24\x10"
+    b"\x42\x44\x22\x24\x12\x10\x42\x44\x22\x24\x12\x12\x10\x42\x44\x22\x24\x12\x12\x12\x10\x42\x44\x22"
+    b"\x24\x12\x12\x12\x12\x10\x42\x44\x22\x24\x12\x12\x12\x12\x12\x10\x42\x44\x22\x24\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x22\x24\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x10\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x10\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x22\x22\x24\x42\x44\x22\x22\x24\x10\x42"
+    b"\x44\x22\x22\x24\x12\x10\x42\x44\x22\x22\x24\x12\x12\x10\x42\x44\x22\x22\x24\x12\x12\x12\x10\x42"
+    b"\x44\x22\x22\x24\x12\x12\x12\x12\x10\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x10\x42\x44\x22\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x10\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x22"
+    b"\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x10\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x22\x22\x24\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x10\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x44\x42\x42\x44\x10\x42\x42\x44\x12\x10\x42\x42\x44\x12\x12\x10\x42\x42\x44\x12\x12\x12"
+    b"\x10\x42\x42\x44\x12\x12\x12\x12\x10\x42\x42\x44\x12\x12\x12\x12\x12\x10\x42\x42\x44\x12\x12\x12"
+    b"\x12\x12\x12\x10\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x44\x24\x42\x42\x44\x24\x10\x42\x42\x44\x24\x12\x10\x42\x42\x44"
+    b"\x24\x12\x12\x10\x42\x42\x44\x24\x12\x12\x12\x10\x42\x42\x44\x24\x12\x12\x12\x12\x10\x42\x42\x44"
+    b"\x24\x12\x12\x12\x12\x12\x10\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x24\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x24\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x44\x22\x24\x42\x42\x44\x22\x24\x10\x42\x42\x44\x22\x24\x12\x10\x42\x42\x44"
+    b"\x22\x24\x12\x12\x10\x42\x42\x44\x22\x24\x12\x12\x12\x10\x42\x42\x44\x22\x24\x12\x12\x12\x12\x10"
+    b"\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x10\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x10\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x22\x22\x24\x42\x42\x44"
+    b"\x22\x22\x24\x10\x42\x42\x44\x22\x22\x24\x12\x10\x42\x42\x44\x22\x22\x24\x12\x12\x10\x42\x42\x44"
+    b"\x22\x22\x24\x12\x12\x12\x10\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x10\x42\x42\x44\x22\x22\x24"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x22\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x22\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42"
+    b"\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x42\x42"
+    b"\x42\x44\x10\x42\x42\x42\x44\x12\x10\x42\x42\x42\x44\x12\x12\x10\x42\x42\x42\x44\x12\x12\x12\x10"
+    b"\x42\x42\x42\x44\x12\x12\x12\x12\x10\x42\x42\x42\x44\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x10\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x24\x42\x42\x42\x44"
+    b"\x24\x10\x42\x42\x42\x44\x24\x12\x10\x42\x42\x42\x44\x24\x12\x12\x10\x42\x42\x42\x44\x24\x12\x12"
+    b"\x12\x10\x42\x42\x42\x44\x24\x12\x12\x12\x12\x10\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x10\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x44\x22\x24\x42\x42\x42\x44\x22\x24\x10\x42\x42\x42\x44\x22\x24\x12\x10"
+    b"\x42\x42\x42\x44\x22\x24\x12\x12\x10\x42\x42\x42\x44\x22\x24\x12\x12\x12\x10\x42\x42\x42\x44\x22"
+    b"\x24\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x24"
+    b"\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x10\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x24\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x22\x24\x42\x42\x42\x44\x22\x22\x24\x10\x42\x42\x42"
+    b"\x44\x22\x22\x24\x12\x10\x42\x42\x42\x44\x22\x22\x24\x12\x12\x10\x42\x42\x42\x44\x22\x22\x24\x12"
+    b"\x12\x12\x10\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x22\x24\x12\x12"
+    b"\x12\x12\x12\x10\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x10\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x44\x42\x42\x42\x42\x44\x10\x42\x42\x42\x42\x44\x12\x10\x42\x42\x42\x42\x44\x12"
+    b"\x12\x10\x42\x42\x42\x42\x44\x12\x12\x12\x10\x42\x42\x42\x42\x44\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x44\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x44\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x24\x42\x42\x42\x42\x44\x24"
+    b"\x10\x42\x42\x42\x42\x44\x24\x12\x10\x42\x42\x42\x42\x44\x24\x12\x12\x10\x42\x42\x42\x42\x44\x24"
+    b"\x12\x12\x12\x10\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x24\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22\x24\x42\x42"
+    b"\x42\x42\x44\x22\x24\x10\x42\x42\x42\x42\x44\x22\x24\x12\x10\x42\x42\x42\x42\x44\x22\x24\x12\x12"
+    b"\x10\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22\x24\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22\x22\x24\x42\x42\x42\x42\x44\x22\x22"
+    b"\x24\x10\x42\x42\x42\x42\x44\x22\x22\x24\x12\x10\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x10\x42"
+    b"\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44"
+    b"\x42\x42\x42\x42\x42\x44\x10\x42\x42\x42\x42\x42\x44\x12\x10\x42\x42\x42\x42\x42\x44\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x44\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x44\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x10\x42\x42"
+    b"\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x10\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x44\x24\x42\x42\x42\x42\x42\x44\x24\x10\x42\x42\x42\x42\x42\x44\x24\x12\x10\x42\x42\x42"
+    b"\x42\x42\x44\x24\x12\x12\x10\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44"
+    b"\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x44\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x24\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42"
+    b"\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x24\x42"
+    b"\x42\x42\x42\x42\x44\x22\x24\x10\x42\x42\x42\x42\x42\x44\x22\x24\x12\x10\x42\x42\x42\x42\x42\x44"
+    b"\x22\x24\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22"
+    b"\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x10\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x44\x22\x22\x24\x42\x42\x42\x42\x42\x44\x22\x22\x24\x10\x42\x42\x42\x42\x42"
+    b"\x44\x22\x22\x24\x12\x10\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x10\x42\x42\x42\x42\x42\x44"
+    b"\x22\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12"
+    b"\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x22\x24"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x10\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x44\x42\x42\x42\x42\x42\x42\x44\x10\x42\x42\x42\x42\x42\x42\x44\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x44\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x44\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x10\x42\x42"
+    b"\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x10\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x44\x24\x42\x42\x42\x42\x42\x42\x44\x24\x10\x42\x42\x42\x42\x42\x42\x44\x24\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x44\x24\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x42\x42\x44\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x24\x42\x42\x42\x42\x42\x42\x44\x22\x24\x10\x42\x42"
+    b"\x42\x42\x42\x42\x44\x22\x24\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x44\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x24"
+    b"\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x10"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12"
+    b"\x10\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x22"
+    b"\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42"
+    b"\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x44\x42\x42\x42\x42\x42\x42\x42\x44\x10\x42\x42\x42\x42\x42\x42\x42\x44\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x42\x42\x42\x44\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x24\x42\x42\x42\x42\x42\x42\x42\x44\x24\x10\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x24\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x24"
+    b"\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12"
+    b"\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22"
+    b"\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x44\x22\x22\x24\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x10\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x22\x22\x24\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x10\x42\x42\x42\x42"
+    b"\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x10\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x44\x42\x42\x42\x42\x42\x42\x42\x42\x44\x10\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x44\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x44\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12"
+    b"\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x24\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x10\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x22\x24\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22"
+    b"\x24\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x44\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x22\x22\x24\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x10\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12"
+    b"\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x44\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x44\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x24\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12"
+    b"\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12"
+    b"\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x22\x24\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x10\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x44\x22\x24\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22"
+    b"\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22"
+    b"\x24\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x22\x22\x24\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x10\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x22\x22\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12"
+    b"\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x10\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12"
+    b"\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x44\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12"
+    b"\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x24\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24"
+    b"\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x44\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x44\x22\x24\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x44\x22\x22\x24\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x10\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22"
+    b"\x22\x24\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x10\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x44\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x10\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x44\x24\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x24\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12"
+    b"\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x22\x24\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22"
+    b"\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12"
+    b"\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12"
+    b"\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x44\x22\x22\x24\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x10"
+    b"\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x22\x22\x24\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24"
+    b"\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44\x22\x22"
+    b"\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x42\x44"
+    b"\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42\x42\x42\x42\x42"
+    b"\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10\x42\x42\x42\x42\x42"
+    b"\x42\x42\x42\x42\x42\x42\x44\x22\x22\x24\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x10"
+)
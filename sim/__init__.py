@@ -0,0 +1,16 @@
+"""
+Host simulator for oneLedWatch.py
+
+Fake machine / utime / uasyncio / micropython modules on a virtual
+clock, so the unmodified firmware runs under CPython:
+
+    from sim import Watch
+    w = Watch()
+    w.press(at_ms=1_000)
+    w.run(60_000)
+    print(w.pulses())
+"""
+
+from sim.core import board, reset, install
+from sim.harness import Watch, load_firmware
+from sim import energy
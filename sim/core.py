@@ -0,0 +1,314 @@
+"""
+Virtual RP2040 board: clock, pins, timers and scripted input.
+
+All sim modules (machine, utime, uasyncio, ...) read and write the
+current Board through board(). reset() starts a fresh one.
+
+Time is an integer count of microseconds since reset. Everything that
+happens at a future time (Timer alarms, uasyncio sleeps, scripted pin
+changes) is one entry in a single heap, so the clock jumps straight to
+the next deadline instead of stepping: a simulated day takes
+milliseconds.
+"""
+
+import heapq
+import sys
+
+_board = None
+
+INPUT = object()        # arg of scripted input events (they run in sleep)
+
+
+class PinState:
+    """Shared state of one GPIO (Pin objects with same id share it)."""
+
+    def __init__(self, id):
+        self.id = id
+        self.level = 0
+        self.mode = None
+        self.pull = None
+        self.handler = None
+        self.trigger = 0
+        self.edges = []         # [(t_us, level)] output edges
+        self.irq_count = 0
+        self.watchers = []      # fn(state) called on every level change
+
+
+class Board:
+    def __init__(self):
+        self.now_us = 0
+        self.pins = {}
+        self.queue = []         # heap of [t_us, seq, fn, arg]
+        self.loop = None        # uasyncio loop, created on demand
+        self.rtc = None
+        self.sms = {}           # rp2 StateMachine objects by id
+        self.freq = 125_000_000
+        self.at_freq = {}       # hz -> [clocked_us, task steps, ISRs]
+        self._freq_t0 = 0       # start of the unbooked clocked time
+        self.isr_count = 0      # Timer callbacks + pin IRQs dispatched
+        self.isr_max_us = 0     # longest ISR body (virtual time)
+        self.in_isr = False
+        self.irq_off = False    # machine.disable_irq(): ISRs wait in pending
+        self.pending = []       # [(fn, arg)] ISRs held while IRQs are off
+        self.asleep = False     # in machine.lightsleep(), until an IRQ
+        self.horizon_us = None  # end of the current run: sleeps stop there
+        self.frozen_us = 0      # time TIMER/RTC stood still (dormant)
+        self.busy_us = {"awake": 0, "irq": 0, "sleep": 0, "dormant": 0}
+        self.regs = {}          # machine.mem32 writes, by address
+        self.usb_pll = True     # PLL_USB running (as after boot)
+        self.usb_us = 0         # clocked time with PLL_USB running
+        self.cdc_stalled = False    # USB host not reading: writes block
+        self._seq = 0
+
+    # --- pins ---
+    def pin(self, id):
+        st = self.pins.get(id)
+        if st is None:
+            st = self.pins[id] = PinState(id)
+        return st
+
+    def drive(self, id, level):
+        """External signal on an input pin (fires IRQ on matching edge)."""
+        st = self.pin(id)
+        level = 1 if level else 0
+        if level == st.level:
+            return
+        st.level = level
+        self._notify(st)
+        trig = 8 if level else 4        # Pin.IRQ_RISING / Pin.IRQ_FALLING
+        if st.handler is not None and st.trigger & trig:
+            from sim import machine
+            self.isr(st.handler, machine.Pin(id))
+            st.irq_count += 1
+
+    def output(self, id, level):
+        """Drive a pin from inside the chip (CPU or PIO), recording edges."""
+        st = self.pin(id)
+        level = 1 if level else 0
+        if level != st.level:
+            st.edges.append((self.now_us, level))
+            st.level = level
+            self._notify(st)
+
+    def _notify(self, st):
+        for fn in list(st.watchers):
+            fn(st)
+
+    # --- clk_sys ---
+    def set_freq(self, hz):
+        """machine.freq(hz): book the time run at the old frequency."""
+        self._book_clock()
+        self.freq = hz
+
+    def _book_clock(self):
+        self._work(0, self.now_us - self._freq_t0)
+        if self.usb_pll:
+            self.usb_us += self.now_us - self._freq_t0
+        self._freq_t0 = self.now_us
+
+    def set_usb_pll(self, on):
+        """PLL_USB powered up or down (charged while clk_sys runs: the
+        lightsleep of MicroPython stops clk_usb itself)."""
+        self._book_clock()
+        self.usb_pll = on
+
+    def _work(self, i, n=1):
+        w = self.at_freq.get(self.freq)
+        if w is None:
+            w = self.at_freq[self.freq] = [0, 0, 0]
+        w[i] += n
+
+    def count_step(self):
+        """A uasyncio task step ran (charged per frequency)."""
+        self._work(1)
+
+    def serial_writable(self):
+        """USB CDC takes a write without blocking."""
+        return self.usb_pll and not self.cdc_stalled
+
+    def clocked(self):
+        """{hz: [clocked_us, steps, isrs]} up to now (sleep excluded).
+        Also books usb_us."""
+        self._book_clock()
+        return {hz: list(w) for hz, w in self.at_freq.items()}
+
+    def isr(self, fn, arg):
+        """Run an interrupt handler, recording its duration. With IRQs
+        off it stays pending until enable_irq() (and ends a sleep)."""
+        self.asleep = False
+        if self.irq_off:
+            self.pending.append((fn, arg))
+            return
+        self.isr_count += 1
+        self._work(2)
+        t0 = self.now_us
+        nested, self.in_isr = self.in_isr, True
+        try:
+            fn(arg)
+        finally:
+            self.in_isr = nested
+        self.isr_max_us = max(self.isr_max_us, self.now_us - t0)
+
+    def disable_irq(self):
+        state, self.irq_off = self.irq_off, True
+        return state
+
+    def enable_irq(self, state):
+        """Restore the IRQ state; run the ISRs that came in meanwhile."""
+        self.irq_off = state
+        while not self.irq_off and self.pending:
+            self.isr(*self.pending.pop(0))
+
+    # --- event queue ---
+    def schedule(self, t_us, fn, arg=None):
+        """Call fn(arg) at t_us. Returns the entry, for cancel()."""
+        self._seq += 1
+        entry = [t_us, self._seq, fn, arg]
+        heapq.heappush(self.queue, entry)
+        return entry
+
+    @staticmethod
+    def cancel(entry):
+        entry[2] = None
+
+    def next_time(self):
+        """Deadline of the next live event, or None."""
+        q = self.queue
+        while q and q[0][2] is None:
+            heapq.heappop(q)
+        return q[0][0] if q else None
+
+    def fire_next(self):
+        """Jump the clock to the next event and run it.
+
+        An event that fell due while the CPU was busy (utime.sleep_ms in
+        an ISR) runs late, at the current time.
+        """
+        t, _, fn, arg = heapq.heappop(self.queue)
+        if t > self.now_us:
+            self.now_us = t
+        fn(arg)
+
+    def at(self, t_us, fn):
+        """Scripted input: call fn() once the clock reaches t_us."""
+        return self.schedule(t_us, lambda _: fn(), INPUT)
+
+    def busy(self, us):
+        """Blocking delay (utime.sleep_ms): clock moves, nothing runs."""
+        self.now_us += us
+        self.busy_us["irq" if self.in_isr else "awake"] += us
+
+    def lightsleep(self, us):
+        """machine.lightsleep(): clk_sys stops until a GPIO IRQ or us pass.
+
+        Only scripted input runs meanwhile. Everything else falling due
+        (Timer alarms, uasyncio sleeps, PIO) waits and runs late, on wake,
+        in its original order. The TIMER (ticks_ms) keeps counting.
+        A sleep reaching the end of the current run returns early, like a
+        spurious wake, so runs can be resumed at exact times. An IRQ
+        pending (IRQs off) ends it at once, like WFI does.
+        """
+        t0, end = self.now_us, self.now_us + us
+        if self.horizon_us is not None:
+            end = min(end, self.horizon_us)
+        self._book_clock()
+        held = []
+        self.asleep = not self.pending
+        while self.asleep:
+            t = self.next_time()
+            if t is None or t > end:
+                self.now_us = end
+                break
+            entry = heapq.heappop(self.queue)
+            if entry[3] is INPUT:
+                self.now_us = max(self.now_us, t)
+                self._freq_t0 = self.now_us     # slept, not clocked
+                entry[2](entry[3])
+            else:
+                held.append(entry)
+        self.asleep = False
+        for entry in held:
+            heapq.heappush(self.queue, entry)
+        self.busy_us["sleep"] += self.now_us - t0
+        self._freq_t0 = self.now_us
+
+    def dormant(self):
+        """machine.lightsleep() without timeout: XOSC dormant, every clock
+        (TIMER, RTC, PIO) stops until a GPIO IRQ.
+
+        Only scripted input runs meanwhile. All other events are due in
+        stopped time, so they move later by the time slept; ticks_ms()
+        and the RTC fall behind by as much (see frozen_us). Ends at the
+        end of the current run like lightsleep().
+        """
+        t0, end = self.now_us, self.horizon_us
+        self._book_clock()
+        held = [e for e in self.queue if e[3] is not INPUT]
+        self.queue = [e for e in self.queue if e[3] is INPUT]
+        heapq.heapify(self.queue)
+        self.asleep = not self.pending
+        while self.asleep:
+            t = self.next_time()
+            if t is None and end is None:
+                raise RuntimeError("dormant: no input left to wake it")
+            if t is None or t > end:
+                self._freeze(end)
+                break
+            entry = heapq.heappop(self.queue)
+            self._freeze(t)             # the wake IRQ sees stopped ticks
+            self._freq_t0 = self.now_us
+            entry[2](entry[3])
+        self.asleep = False
+        slept = self.now_us - t0
+        for entry in held:
+            entry[0] += slept
+            heapq.heappush(self.queue, entry)
+        self.busy_us["dormant"] += slept
+        self._freq_t0 = self.now_us
+
+    def _freeze(self, t_us):
+        """Move the clock to t_us with TIMER and RTC standing still."""
+        if t_us > self.now_us:
+            self.frozen_us += t_us - self.now_us
+            self.now_us = t_us
+
+    def ticks_us(self):
+        """TIMER count: virtual time less the time it stood still."""
+        return self.now_us - self.frozen_us
+
+    def advance(self, us):
+        """Run events for us microseconds without a uasyncio loop."""
+        end = self.now_us + us
+        while True:
+            t = self.next_time()
+            if t is None or t > end:
+                break
+            self.fire_next()
+        self.now_us = max(self.now_us, end)
+
+
+def board():
+    global _board
+    if _board is None:
+        _board = Board()
+    return _board
+
+
+def reset():
+    """Fresh board: clock at 0, no pins, timers or tasks."""
+    global _board
+    if _board is not None and _board.loop is not None:
+        _board.loop.close()
+    _board = Board()
+    return _board
+
+
+MODULES = ("machine", "utime", "uasyncio", "micropython", "rp2", "uselect",
+           "ustruct")
+
+
+def install():
+    """Make the sim modules importable under their MicroPython names."""
+    import importlib
+    for name in MODULES:
+        sys.modules[name] = importlib.import_module("sim." + name)
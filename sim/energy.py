@@ -0,0 +1,108 @@
+"""
+Energy model: split a finished sim run into power states and integrate.
+
+States (mutually exclusive CPU states + LED on top):
+  "awake" – CPU running Python: task steps (main() loop, display)
+            plus blocking delays outside ISRs
+  "irq"   – CPU servicing Timer callbacks (tick()) and pin IRQs,
+            including blocking delays inside them
+  "idle"  – uasyncio idle, CPU waiting for the next event (WFE)
+  "sleep" – machine.lightsleep(), clk_sys stopped
+  "dormant" – machine.lightsleep() without timeout, XOSC stopped
+  "led"   – GP25 LED on (added to whatever the CPU does)
+  "usb"   – PLL_USB and the USB clock domain running, while clk_sys
+            runs (added like "led"; the firmware stops it on battery)
+
+Python code takes no virtual time in the simulator, so each task step
+and each ISR is charged a fixed CPU cost (COSTS_US).
+
+Currents and costs are rough Pico figures at F_REF (RP2040 @ 125 MHz),
+in mA; override per call to model other boards. At another
+machine.freq() the costs stretch by F_REF / freq and the clocked
+states' currents shrink towards their STATIC share.
+"""
+
+F_REF = 125_000_000
+
+CURRENTS_MA = {
+    "awake": 25.0,
+    "irq": 25.0,
+    "idle": 18.0,
+    "sleep": 1.4,
+    "dormant": 0.18,    # RP2040 alone, a board regulator adds to this
+    "led": 2.5,
+    "usb": 2.0,         # PLL_USB (480 MHz VCO) + clk_usb, not freq scaled
+}
+
+COSTS_US = {
+    "step": 150,        # one uasyncio task resumption
+    "isr": 30,          # IRQ entry/exit + short handler body
+}
+
+CLOCKED = ("awake", "irq", "idle")  # states that scale with clk_sys
+STATIC = 0.35       # share of a clocked state's current independent of freq
+
+DAY_US = 86_400_000_000
+
+
+def freq_scale(hz):
+    """Clocked-state current at hz relative to F_REF."""
+    return STATIC + (1 - STATIC) * hz / F_REF
+
+
+def isr_us(hz, costs=COSTS_US):
+    """CPU time of one ISR (latency to handler end) at clk_sys hz."""
+    return costs["isr"] * F_REF / hz
+
+
+def by_freq(w, costs=COSTS_US):
+    """Clocked states in us per machine.freq() value of the run."""
+    b = w.board
+    out = {}
+    for hz, (clocked, steps, isrs) in b.clocked().items():
+        awake = int(steps * costs["step"] * F_REF / hz)
+        irq = int(isrs * isr_us(hz, costs))
+        if hz == b.freq:                # blocking delays: booked at the end
+            awake += b.busy_us["awake"]
+            irq += b.busy_us["irq"]
+        out[hz] = {"awake": awake, "irq": irq,
+                   "idle": max(0, clocked - awake - irq)}
+    return out
+
+
+def intervals(w, costs=COSTS_US):
+    """Time in us spent in each state over the run of sim.Watch w."""
+    b = w.board
+    iv = {"total": b.now_us, "awake": 0, "irq": 0, "idle": 0,
+          "sleep": b.busy_us["sleep"], "dormant": b.busy_us["dormant"],
+          "led": int(sum(d for _, d in w.pulses()) * 1000)}
+    for states in by_freq(w, costs).values():
+        for k in CLOCKED:
+            iv[k] += states[k]
+    iv["usb"] = b.usb_us            # booked by by_freq()
+    return iv
+
+
+def report(w, currents=CURRENTS_MA, costs=COSTS_US, capacity_mah=None):
+    """mAh used, mean current and (optionally) battery life of a run."""
+    iv = intervals(w, costs)
+    bf = by_freq(w, costs)
+    charge = {}
+    for k, ma in currents.items():
+        if k in CLOCKED:
+            us = sum(st[k] * freq_scale(hz) for hz, st in bf.items())
+        else:
+            us = iv[k]
+        charge[k] = us * ma / 3.6e9
+    mah = sum(charge.values())
+    hours = iv["total"] / 3.6e9
+    out = {
+        "state_us": iv,
+        "mah_by_state": charge,
+        "mah": mah,
+        "mean_ma": mah / hours if hours else 0.0,
+        "mah_per_day": mah * DAY_US / iv["total"] if iv["total"] else 0.0,
+    }
+    if capacity_mah is not None and mah:
+        out["battery_life_h"] = capacity_mah / out["mean_ma"]
+    return out
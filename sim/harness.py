@@ -0,0 +1,137 @@
+"""
+Run oneLedWatch.py on the virtual board and script a user.
+
+    w = Watch(CLOCK_MODE="tick")
+    w.press(at_ms=2_000)
+    w.run(60_000)
+    w.led_edges         # [(t_ms, level), ...]
+    w.fw.stats          # firmware counters
+
+Keyword arguments become a fake watch_config module, which the
+firmware star-imports to override its settings. The board runs from
+battery unless usb=True (VBUS high on GP24 at boot); plug() scripts
+the cable.
+
+w.log holds the firmware's log records at the time they were logged,
+whether or not they reached the host; w.serial what was printed.
+"""
+
+import functools
+import importlib.util
+import os
+import sys
+import types
+
+from sim import core as _b
+
+FIRMWARE = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "oneLedWatch.py")
+
+
+def load_firmware(path=FIRMWARE, **settings):
+    """Import a fresh copy of the firmware with settings overridden."""
+    _b.install()
+    fw_dir = os.path.dirname(os.path.abspath(path))
+    if fw_dir not in sys.path:
+        sys.path.insert(0, fw_dir)          # pulse_table.py etc., like / on flash
+    cfg = types.ModuleType("watch_config")
+    cfg.__dict__.update(settings)
+    sys.modules["watch_config"] = cfg
+    try:
+        spec = importlib.util.spec_from_file_location("oneLedWatch", path)
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+    finally:
+        del sys.modules["watch_config"]
+    return mod
+
+
+VBUS_PIN = 24           # Pico: VBUS sense
+CDC_TX_TIMEOUT_US = 500_000     # MicroPython gives up a USB CDC write
+
+
+class Watch:
+    def __init__(self, path=FIRMWARE, usb=False, **settings):
+        self.board = _b.reset()
+        self.board.pin(VBUS_PIN).level = 1 if usb else 0
+        self.log = []
+        self.fw = load_firmware(path, **settings)
+        self.serial = []        # lines printed to USB serial
+        self.fw.print = self._print         # capture, don't spam stdout
+        self._records = hasattr(self.fw, "log_event")
+        if self._records:                   # log at event time, any source
+            self.fw.log_event = self._probe(self.fw.log_event)
+        self.loop = sys.modules["uasyncio"].get_event_loop()
+        self.main = None
+        self.presses = []       # scripted press times (ms)
+
+    def _print(self, *args, **kwargs):
+        """print() to USB CDC: blocks until its timeout while the host
+        doesn't read (board.cdc_stalled)."""
+        line = (self.now_ms, " ".join(str(a) for a in args))
+        self.serial.append(line)
+        if self.board.cdc_stalled:
+            self.board.busy(CDC_TX_TIMEOUT_US)
+        if not self._records:
+            self.log.append(line)
+
+    def _probe(self, log_event):
+        @functools.wraps(log_event)
+        def probe(*args):
+            log_event(*args)
+            self.log.append((self.now_ms,
+                             self.fw.log_text(self.fw.log_head - 1)))
+        return probe
+
+    @property
+    def now_ms(self):
+        return self.board.now_us / 1000
+
+    # --- user input ---
+    def press(self, at_ms, hold_ms=200, bounces=0, bounce_ms=1):
+        """Push the button at at_ms for hold_ms, with contact bounce."""
+        pin = self.fw.BUTTON_PIN
+        self.presses.append(at_ms)
+        t = int(at_ms * 1000)
+        for i in range(bounces):
+            self.board.at(t, lambda: self.board.drive(pin, 0))
+            self.board.at(t + int(bounce_ms * 500),
+                          lambda: self.board.drive(pin, 1))
+            t += int(bounce_ms * 1000)
+        self.board.at(t, lambda: self.board.drive(pin, 0))
+        self.board.at(int((at_ms + hold_ms) * 1000),
+                      lambda: self.board.drive(pin, 1))
+
+    def plug(self, at_ms, usb=True):
+        """Connect (or with usb=False pull) the USB cable at at_ms."""
+        self.board.at(int(at_ms * 1000),
+                      lambda: self.board.drive(VBUS_PIN, usb))
+
+    # --- run ---
+    def run(self, ms):
+        """Advance simulated time by ms, starting main() on first call."""
+        if self.main is None:
+            self.main = self.loop.create_task(self.fw.main())
+        self.loop.run_until(self.board.now_us + int(ms * 1000))
+
+    def run_until(self, t_ms):
+        self.run(max(0, t_ms - self.now_ms))
+
+    # --- observations ---
+    @property
+    def led_edges(self):
+        return [(t / 1000, v) for t, v in
+                self.board.pin(self.fw.LED_PIN).edges]
+
+    def pulses(self, since_ms=0):
+        """LED on-intervals as [(start_ms, length_ms)]."""
+        out, start = [], None
+        for t, v in self.led_edges:
+            if t < since_ms:
+                continue
+            if v:
+                start = t
+            elif start is not None:
+                out.append((start, t - start))
+                start = None
+        return out
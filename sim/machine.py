@@ -0,0 +1,253 @@
+"""
+Fake machine module: Pin, Timer, RTC, mem32, freq(), lightsleep() and
+disable_irq()/enable_irq() on the virtual board.
+"""
+
+import datetime
+import functools
+
+from sim.core import board
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self._st = board().pin(id)
+        if mode != -1 or pull != -1 or value is not None:
+            self.init(mode, pull, value)
+
+    def init(self, mode=-1, pull=-1, value=None):
+        st = self._st
+        if mode != -1:
+            st.mode = mode
+        if pull != -1:
+            st.pull = pull
+            if st.mode == Pin.IN:
+                st.level = 1 if pull == Pin.PULL_UP else 0
+        if value is not None:
+            self.value(value)
+
+    def value(self, v=None):
+        st = self._st
+        if v is None:
+            return st.level
+        if st.mode == Pin.OUT:
+            board().output(self.id, v)
+        else:
+            st.level = 1 if v else 0
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def toggle(self):
+        self.value(1 - self._st.level)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, hard=False):
+        st = self._st
+        st.handler = handler
+        st.trigger = trigger if handler is not None else 0
+
+    def __repr__(self):
+        return "Pin(%d)" % self.id
+
+
+class Timer:
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1, **kwargs):
+        self.entry = None
+        self.callback = None
+        if kwargs:
+            self.init(**kwargs)
+
+    def init(self, mode=PERIODIC, period=-1, freq=-1, callback=None):
+        if freq != -1:
+            period = 1000 / freq
+        self.deinit()
+        b = board()
+        self.mode = mode
+        self.period_us = int(period * 1000)
+        self.callback = callback
+        self.start_us = b.ticks_us()      # TIMER time: stops in dormant
+        self.count = 0
+        self.entry = b.schedule(b.now_us + self.period_us, self._fire)
+
+    def deinit(self):
+        if self.entry is not None:
+            board().cancel(self.entry)
+            self.entry = None
+
+    def _fire(self, _):
+        """Alarm reached: rearm (periodic, no drift) and run callback."""
+        b = board()
+        self.count += 1
+        if self.mode == Timer.PERIODIC:
+            t = self.start_us + (self.count + 1) * self.period_us
+            self.entry = b.schedule(b.now_us + t - b.ticks_us(), self._fire)
+        else:
+            self.entry = None
+        if self.callback is not None:
+            b.isr(self.callback, self)
+
+
+_EPOCH = datetime.datetime(2000, 1, 1)
+
+
+class RTC:
+    """Counts virtual time from the last datetime() set (stops in
+    dormant, like the TIMER)."""
+
+    def __init__(self):
+        b = board()
+        if b.rtc is None:
+            b.rtc = [_EPOCH, 0]     # [datetime at set, now_us at set]
+        self._st = b.rtc
+
+    def datetime(self, dt=None):
+        if dt is not None:
+            year, month, day, _, h, m, s = dt[:7]
+            self._st[0] = datetime.datetime(year, month, day, h, m, s)
+            self._st[1] = board().ticks_us()
+            return
+        now = self.now()
+        return (now.year, now.month, now.day, now.weekday(),
+                now.hour, now.minute, now.second, 0)
+
+    def now(self):
+        base, t0 = self._st
+        return base + datetime.timedelta(
+            seconds=(board().ticks_us() - t0) // 1_000_000)
+
+
+# Registers mem32 models; any other address just stores what is written
+CLK_USB_CTRL = 0x40008054
+CLK_RTC_CTRL = 0x4000806c
+CLK_RTC_DIV = 0x40008070
+PLL_USB_CS = 0x4002c000
+PLL_USB_PWR = 0x4002c004
+RTC_0 = 0x4005c01c      # read-only: DOTW, HOUR, MIN, SEC of the RTC
+_ENABLE = 1 << 11
+_LOCK = 1 << 31
+_XOSC = 3               # CLK_RTC_CTRL AUXSRC xosc_clksrc
+
+_RESET = {              # after boot: clk_rtc = PLL_USB / 1024 = 46875 Hz
+    CLK_USB_CTRL: _ENABLE,
+    CLK_RTC_CTRL: _ENABLE,
+    CLK_RTC_DIV: 1024 << 8,
+    PLL_USB_CS: _LOCK | 1,
+    PLL_USB_PWR: 0,
+}
+
+
+class _Mem32:
+    """mem32[addr]: a register file. PLL_USB_PWR switches the board's
+    PLL_USB; the writes that would break the RTC on the chip raise:
+    switching clk_rtc's AUXSRC while enabled, or powering PLL_USB down
+    while clk_rtc is not 46875 Hz from the 12 MHz XOSC. RTC_0 reads the
+    RTC."""
+
+    def __getitem__(self, addr):
+        if addr == RTC_0:
+            now = RTC().now()
+            return ((now.weekday() + 1) % 7 << 24 | now.hour << 16
+                    | now.minute << 8 | now.second)
+        return board().regs.get(addr, _RESET.get(addr, 0))
+
+    def __setitem__(self, addr, value):
+        b = board()
+        value &= 0xFFFFFFFF
+        old = self[addr]
+        if addr == CLK_RTC_CTRL and old & _ENABLE \
+                and (old ^ value) & 7 << 5:
+            raise RuntimeError("clk_rtc AUXSRC changed while enabled")
+        if addr == PLL_USB_PWR:
+            on = not value & 1
+            if not on and not (self[CLK_RTC_CTRL] >> 5 & 7 == _XOSC
+                               and self[CLK_RTC_DIV] >> 8 == 256):
+                raise RuntimeError("PLL_USB off: clk_rtc still needs it")
+            b.set_usb_pll(on)
+            cs = self[PLL_USB_CS]
+            b.regs[PLL_USB_CS] = cs | _LOCK if on else cs & ~_LOCK
+        b.regs[addr] = value
+
+
+mem32 = _Mem32()
+
+
+def freq(hz=None):
+    b = board()
+    if hz is None:
+        return b.freq
+    if not _sys_clock_ok(int(hz)):
+        raise ValueError("cannot change frequency")
+    b.set_freq(int(hz))
+
+
+@functools.lru_cache(maxsize=None)
+def _sys_clock_ok(hz):
+    """pico-sdk check_sys_clock_khz(): PLL_SYS makes hz from the 12 MHz
+    crystal as VCO / (pd1 * pd2), VCO = 12 MHz * fbdiv in 750–1600 MHz,
+    post dividers 7 >= pd1 >= pd2 >= 1. Cached: every wake asks again."""
+    if hz % 1000:
+        return False
+    for fbdiv in range(320, 15, -1):
+        vco = fbdiv * 12_000_000
+        if not 750_000_000 <= vco <= 1_600_000_000:
+            continue
+        for pd1 in range(7, 0, -1):
+            for pd2 in range(pd1, 0, -1):
+                if vco == hz * pd1 * pd2:
+                    return True
+    return False
+
+
+def lightsleep(ms=None):
+    if ms is None:
+        board().dormant()
+    else:
+        board().lightsleep(int(ms) * 1000)
+    _clocks_init()
+
+
+def _clocks_init():
+    """rp2's lightsleep() runs pico-sdk clocks_init() on wake: clk_sys
+    back at 125 MHz, PLL_USB and clk_usb on, clk_rtc = PLL_USB / 1024."""
+    b = board()
+    if b.regs:
+        for addr in _RESET:
+            b.regs.pop(addr, None)
+    if not b.usb_pll:
+        b.set_usb_pll(True)
+    if b.freq != 125_000_000:
+        b.set_freq(125_000_000)
+
+
+def disable_irq():
+    return board().disable_irq()
+
+
+def enable_irq(state):
+    board().enable_irq(state)
+
+
+def reset():
+    raise SystemExit("machine.reset()")
+
+
+def unique_id():
+    return b"\xe6\x61\x00\x00\x00\x00\x00\x00"
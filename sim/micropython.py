@@ -0,0 +1,23 @@
+"""
+Fake micropython module.
+"""
+
+
+def const(x):
+    return x
+
+
+def schedule(fn, arg):
+    fn(arg)
+
+
+def alloc_emergency_exception_buf(size):
+    pass
+
+
+def opt_level(level=None):
+    return 0 if level is None else None
+
+
+def mem_info(verbose=False):
+    print("mem: (simulator)")
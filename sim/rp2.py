@@ -0,0 +1,499 @@
+"""
+Fake rp2 module: PIO assembler and a state-machine interpreter.
+
+@asm_pio runs the program body with the PIO DSL names (wait, jmp, set,
+out, ...) as its globals, like MicroPython does, and records the
+instructions. StateMachine executes them on the virtual board at the
+configured freq (a clk_sys divider), one instruction per 1 + delay
+cycles. To stay fast it
+  - parks on pin changes while blocked in wait(),
+  - parks on the TX FIFO while blocked in pull(block),
+  - runs a `jmp(x_dec, <itself>)` delay loop in one step.
+Only the instructions used by oneLedWatch.py are modelled in depth;
+irq(block)/wait(irq), autopush/autopull and exec are not.
+
+DMA models channels that copy a buffer into a PIO TX FIFO (written by
+its bus address), paced by the FIFO's DREQ, at no time cost.
+"""
+
+import math
+import types
+from collections import deque
+
+from sim.core import board
+
+_MASK32 = 0xFFFFFFFF
+
+
+class PIO:
+    IN_LOW = 0
+    IN_HIGH = 1
+    OUT_LOW = 2
+    OUT_HIGH = 3
+    SHIFT_LEFT = 0
+    SHIFT_RIGHT = 1
+    JOIN_NONE = 0
+    JOIN_TX = 1
+    JOIN_RX = 2
+
+    def __init__(self, id):
+        self.id = id
+
+    def state_machine(self, id, *args, **kwargs):
+        return StateMachine(self.id * 4 + id, *args, **kwargs)
+
+
+# ------------------------------------------------------------
+# Assembler
+# ------------------------------------------------------------
+class _Op:
+    def __init__(self, kind, *args):
+        self.kind = kind
+        self.args = args
+        self.delay = 0
+        self.side_value = None
+
+    def __getitem__(self, delay):
+        self.delay = delay
+        return self
+
+    def side(self, value):
+        self.side_value = value
+        return self
+
+    def __repr__(self):
+        return "%s%r[%d]" % (self.kind, self.args, self.delay)
+
+
+class Program:
+    def __init__(self, config):
+        self.config = config
+        self.ops = []
+        self.labels = {}
+        self.wrap_target = 0
+        self.wrap = None
+
+    def add(self, op):
+        self.ops.append(op)
+        return op
+
+    def target(self, label):
+        return label if isinstance(label, int) else self.labels[label]
+
+
+def _dsl(prog):
+    ns = {"__builtins__": {}}
+
+    def op(kind):
+        return lambda *args: prog.add(_Op(kind, *args))
+
+    for kind in ("wait", "in_", "out", "push", "pull", "mov", "set", "nop"):
+        ns[kind] = op(kind)
+
+    def jmp(*args):
+        cond, label = (None, args[0]) if len(args) == 1 else args
+        return prog.add(_Op("jmp", cond, label))
+
+    def irq(*args):
+        mod, index = (None, args[0]) if len(args) == 1 else args
+        return prog.add(_Op("irq", mod, index))
+
+    def label(name):
+        prog.labels[name] = len(prog.ops)
+
+    def wrap_target():
+        prog.wrap_target = len(prog.ops)
+
+    def wrap():
+        prog.wrap = len(prog.ops) - 1
+
+    ns.update(jmp=jmp, irq=irq, label=label, wrap_target=wrap_target,
+              wrap=wrap, rel=lambda i: ("rel", i),
+              invert=lambda s: ("invert", s), reverse=lambda s: ("reverse", s))
+    for name in ("pin", "pins", "pindirs", "x", "y", "null", "isr", "osr",
+                 "gpio", "pc", "exec", "status", "block", "noblock", "clear",
+                 "x_dec", "y_dec", "not_x", "not_y", "x_not_y", "not_osre",
+                 "iffull", "ifempty"):
+        ns[name] = name
+    return ns
+
+
+def asm_pio(**config):
+    def deco(fn):
+        prog = Program(config)
+        types.FunctionType(fn.__code__, _dsl(prog), fn.__name__)()
+        if prog.wrap is None:
+            prog.wrap = len(prog.ops) - 1
+        return prog
+    return deco
+
+
+# ------------------------------------------------------------
+# State machine
+# ------------------------------------------------------------
+def _pin_id(p):
+    return None if p is None else getattr(p, "id", p)
+
+
+def _count(init):
+    return len(init) if isinstance(init, (tuple, list)) else 1
+
+
+class StateMachine:
+    def __new__(cls, id, *args, **kwargs):
+        sms = board().sms
+        if id not in sms:
+            sm = sms[id] = object.__new__(cls)
+            sm.id = id
+            sm.prog = None
+            sm.running = False
+            sm.entry = None
+            sm.handler = None
+            sm.tx = deque()
+            sm.rx = deque()
+            sm.tx_waiters = []      # fn() called when TX FIFO has space
+        return sms[id]
+
+    def __init__(self, id, prog=None, freq=-1, **kwargs):
+        if prog is not None:
+            self.init(prog, freq, **kwargs)
+
+    def init(self, prog, freq=-1, *, in_base=None, out_base=None,
+             set_base=None, jmp_pin=None, sideset_base=None,
+             in_shiftdir=None, out_shiftdir=None,
+             push_thresh=None, pull_thresh=None):
+        self.active(0)
+        b = board()
+        cfg = prog.config
+        self.prog = prog
+        # clkdiv is fixed here: a later machine.freq() change scales the
+        # SM's rate until it is init()ed again, as on the chip
+        self.div = 1.0 if freq == -1 else b.freq / freq
+        if self.div < 1:
+            raise ValueError("freq above clk_sys")
+        self.in_base = _pin_id(in_base)
+        self.out_base = _pin_id(out_base)
+        self.set_base = _pin_id(set_base)
+        self.jmp_pin = _pin_id(jmp_pin)
+        self.sideset_base = _pin_id(sideset_base)
+        self.out_count = _count(cfg.get("out_init"))
+        self.set_count = _count(cfg.get("set_init"))
+        self.out_right = (cfg.get("out_shiftdir", 0) if out_shiftdir is None
+                          else out_shiftdir) == PIO.SHIFT_RIGHT
+        self.in_right = (cfg.get("in_shiftdir", 0) if in_shiftdir is None
+                         else in_shiftdir) == PIO.SHIFT_RIGHT
+        self.depth = 8 if cfg.get("fifo_join", 0) == PIO.JOIN_TX else 4
+        for base, key in ((self.out_base, "out_init"),
+                          (self.set_base, "set_init"),
+                          (self.sideset_base, "sideset_init")):
+            init = cfg.get(key)
+            if base is None or init is None:
+                continue
+            inits = init if isinstance(init, (tuple, list)) else (init,)
+            for i, v in enumerate(inits):
+                if v in (PIO.OUT_LOW, PIO.OUT_HIGH):
+                    b.output(base + i, v == PIO.OUT_HIGH)
+        self.restart()
+
+    def restart(self):
+        self.pc = 0
+        self.x = self.y = self.isr = self.osr = 0
+        self.isr_count = 0
+        self.osr_count = 32
+        self.tx.clear()
+        self.rx.clear()
+
+    # --- control ---
+    def active(self, value=None):
+        if value is None:
+            return self.running
+        b = board()
+        if value and not self.running:
+            self.running = True
+            self.t = float(b.now_us)
+            self._wake()
+        elif not value and self.running:
+            self.running = False
+            self._unpark()
+
+    def irq(self, handler=None, trigger=0, hard=False):
+        self.handler = handler
+
+    def put(self, value, shift=0):
+        values = value if hasattr(value, "__iter__") else (value,)
+        b = board()
+        for v in values:
+            t0 = b.now_us
+            while len(self.tx) >= self.depth and b.next_time() is not None:
+                b.fire_next()           # CPU blocks until FIFO has space
+            b.busy_us["irq" if b.in_isr else "awake"] += b.now_us - t0
+            self._push_tx((v << shift) & _MASK32)
+
+    def get(self, buf=None, shift=0):
+        b = board()
+        while not self.rx and b.next_time() is not None:
+            b.fire_next()
+        return self.rx.popleft() >> shift
+
+    def tx_fifo(self):
+        return len(self.tx)
+
+    def rx_fifo(self):
+        return len(self.rx)
+
+    def _push_tx(self, v):
+        self.tx.append(v)
+        if self.running and self.parked == "fifo":
+            self._wake()
+
+    # --- execution ---
+    parked = None
+
+    def _unpark(self):
+        b = board()
+        if self.entry is not None:
+            b.cancel(self.entry)
+            self.entry = None
+        if isinstance(self.parked, int):
+            b.pin(self.parked).watchers.remove(self._pin_changed)
+        self.parked = None
+
+    def _park_pin(self, gpio):
+        self.parked = gpio
+        board().pin(gpio).watchers.append(self._pin_changed)
+
+    def _pin_changed(self, st):
+        self._unpark()
+        self._wake()
+
+    def _wake(self):
+        b = board()
+        self.parked = None
+        self.t = max(self.t, float(b.now_us))
+        if self.entry is None:
+            self.entry = b.schedule(int(math.ceil(self.t)), self._run)
+
+    def _run(self, _):
+        b = board()
+        self.entry = None
+        period = 1e6 * self.div / b.freq
+        ops = self.prog.ops
+        while self.running:
+            if self.t > b.now_us:
+                self.entry = b.schedule(int(math.ceil(self.t)), self._run)
+                return
+            op = ops[self.pc]
+            if op.side_value is not None and self.sideset_base is not None:
+                b.output(self.sideset_base, op.side_value & 1)
+            cycles = self._exec(op, period)
+            if cycles is None:          # blocked, parked on pin / FIFO
+                return
+            self.t += cycles * period
+
+    def _exec(self, op, period):
+        """Run op; return cycles used, or None if it blocked."""
+        b = board()
+        a = op.args
+        k = op.kind
+        nxt = self.pc + 1 if self.pc != self.prog.wrap else self.prog.wrap_target
+        if k == "wait":
+            pol, src, idx = a
+            gpio = idx if src == "gpio" else self.in_base + idx
+            if b.pin(gpio).level != pol:
+                self._park_pin(gpio)
+                return None
+        elif k == "jmp":
+            cond, label = a
+            target = self.prog.target(label)
+            if cond == "x_dec" and target == self.pc:
+                n = self.x + 1          # whole delay loop in one step
+                self.x = _MASK32
+                self.pc = nxt
+                return n * (1 + op.delay)
+            if self._cond(cond):
+                nxt = target
+        elif k == "set":
+            dest, v = a
+            if dest == "pins":
+                for i in range(self.set_count):
+                    b.output(self.set_base + i, (v >> i) & 1)
+            elif dest in ("x", "y"):
+                setattr(self, dest, v)
+        elif k == "pull":
+            mode = a[0] if a else "block"
+            if self.tx:
+                self.osr = self.tx.popleft()
+                self.osr_count = 0
+                for fn in list(self.tx_waiters):
+                    fn()
+            elif mode == "block":
+                self.parked = "fifo"
+                return None
+            else:
+                self.osr = self.x
+        elif k == "out":
+            dest, bits = a
+            mask = (1 << bits) - 1
+            if self.out_right:
+                v = self.osr & mask
+                self.osr >>= bits
+            else:
+                v = (self.osr >> (32 - bits)) & mask
+                self.osr = (self.osr << bits) & _MASK32
+            self.osr_count += bits
+            if dest == "pins":
+                for i in range(min(bits, self.out_count)):
+                    b.output(self.out_base + i, (v >> i) & 1)
+            elif dest in ("x", "y"):
+                setattr(self, dest, v)
+            elif dest == "pc":
+                nxt = v
+        elif k == "in_":
+            src, bits = a
+            v = 0
+            if src == "pins":
+                for i in range(bits):
+                    v |= b.pin(self.in_base + i).level << i
+            elif src in ("x", "y", "osr"):
+                v = getattr(self, src)
+            v &= (1 << bits) - 1
+            if self.in_right:
+                self.isr = (self.isr >> bits) | (v << (32 - bits))
+            else:
+                self.isr = ((self.isr << bits) | v) & _MASK32
+            self.isr_count += bits
+        elif k == "push":
+            self.rx.append(self.isr)
+            self.isr = self.isr_count = 0
+        elif k == "mov":
+            dest, src = a
+            v = self._read(src)
+            if dest == "pins":
+                for i in range(self.out_count):
+                    b.output(self.out_base + i, (v >> i) & 1)
+            else:
+                setattr(self, dest, v)
+        elif k == "irq":
+            mod, index = a
+            if isinstance(index, tuple):        # rel(i)
+                index = (index[1] + self.id) & 3
+            if mod != "clear" and index == self.id % 4 \
+                    and self.handler is not None:
+                b.isr(self.handler, self)
+        self.pc = nxt
+        return 1 + op.delay
+
+    def _cond(self, cond):
+        if cond is None:
+            return True
+        if cond == "not_x":
+            return self.x == 0
+        if cond == "not_y":
+            return self.y == 0
+        if cond in ("x_dec", "y_dec"):
+            reg = cond[0]
+            v = getattr(self, reg)
+            setattr(self, reg, (v - 1) & _MASK32)
+            return v != 0
+        if cond == "x_not_y":
+            return self.x != self.y
+        if cond == "pin":
+            return board().pin(self.jmp_pin).level == 1
+        if cond == "not_osre":
+            return self.osr_count < 32
+        raise ValueError(cond)
+
+    def _read(self, src):
+        if isinstance(src, tuple):
+            kind, inner = src
+            v = self._read(inner)
+            if kind == "invert":
+                return ~v & _MASK32
+            return int("{:032b}".format(v)[::-1], 2)
+        if src == "null":
+            return 0
+        if src == "pins":
+            return sum(board().pin(self.in_base + i).level << i
+                       for i in range(32) if self.in_base + i in board().pins)
+        return getattr(self, src)
+
+
+# ------------------------------------------------------------
+# DMA
+# ------------------------------------------------------------
+_PIO_BASE = (0x50200000, 0x50300000)
+_TXF0 = 0x010
+
+
+def _fifo_sm(addr):
+    """StateMachine whose TX FIFO is at bus address addr."""
+    for pio, base in enumerate(_PIO_BASE):
+        off = addr - base - _TXF0
+        if 0 <= off < 16 and off % 4 == 0:
+            return StateMachine(pio * 4 + off // 4)
+    raise ValueError("sim DMA only writes PIO TX FIFOs: 0x%08x" % addr)
+
+
+class DMA:
+    """One channel; ctrl words use the RP2040 CTRL_TRIG bit layout."""
+
+    def __init__(self):
+        b = board()
+        self.channel = getattr(b, "dma_next", 0)
+        b.dma_next = self.channel + 1
+        self._src = None
+        self._sm = None
+        self.ctrl = 0
+
+    @staticmethod
+    def pack_ctrl(default=None, *, enable=True, high_pri=False, size=2,
+                  inc_read=True, inc_write=True, ring_size=0, ring_sel=False,
+                  chain_to=0, treq_sel=0x3F, irq_quiet=True, bswap=False,
+                  sniff_en=False):
+        return (enable | high_pri << 1 | size << 2 | inc_read << 4
+                | inc_write << 5 | ring_size << 6 | ring_sel << 10
+                | chain_to << 11 | treq_sel << 15 | irq_quiet << 21
+                | bswap << 22 | sniff_en << 23)
+
+    @staticmethod
+    def unpack_ctrl(ctrl):
+        return {"enable": ctrl & 1, "size": (ctrl >> 2) & 3,
+                "inc_read": (ctrl >> 4) & 1, "inc_write": (ctrl >> 5) & 1,
+                "treq_sel": (ctrl >> 15) & 0x3F}
+
+    def config(self, read=None, write=None, count=None, ctrl=None,
+               trigger=False):
+        self.active(0)
+        if read is not None:
+            self._src = read
+        if write is not None:
+            self._sm = _fifo_sm(write)
+        if ctrl is not None:
+            self.ctrl = ctrl
+        self.count = len(self._src) if count is None else count
+        self._pos = 0
+        if trigger:
+            self.active(1)
+
+    def active(self, value=None):
+        sm = self._sm
+        running = sm is not None and self._feed in sm.tx_waiters
+        if value is None:
+            return running
+        if value and not running and self._pos < self.count:
+            sm.tx_waiters.append(self._feed)
+            self._feed()
+        elif not value and running:
+            sm.tx_waiters.remove(self._feed)
+
+    def _feed(self):
+        """DREQ: copy words while the FIFO has room."""
+        sm = self._sm
+        while self._pos < self.count and len(sm.tx) < sm.depth:
+            sm._push_tx(self._src[self._pos] & _MASK32)
+            self._pos += 1
+        if self._pos >= self.count:
+            sm.tx_waiters.remove(self._feed)
+
+    def close(self):
+        self.active(0)
@@ -0,0 +1,376 @@
+"""
+Fake uasyncio: a small cooperative scheduler on the virtual clock.
+
+Coroutines yield to the loop through the awaitables below:
+  - a number  -> sleep that many ms, from the current ticks_ms()
+  - None      -> reschedule immediately, unless core._io_queue.queue_read()
+                 parked the task on a ThreadSafeFlag
+  - an object with _add_waiter()/_remove_waiter() (Task, Event,
+    ThreadSafeFlag) -> park until it wakes the task
+
+The loop runs every ready task, then jumps the board clock to the next
+entry of the board event queue (sleep deadline, Timer alarm or scripted
+pin change / IRQ) and runs it.
+
+Loop.allocs counts the objects MicroPython's uasyncio would allocate on
+the heap: tasks, wait() generators, thrown CancelledErrors.
+Loop.io_entries counts the IOQueue entries (a list plus a poller
+registration) of ThreadSafeFlag waits that park, apart: every such wait
+allocates one.
+"""
+
+import sys
+from collections import deque
+
+from sim.core import board
+
+
+class CancelledError(BaseException):
+    pass
+
+
+class TimeoutError(Exception):
+    pass
+
+
+class _Sleep:
+    """The awaitable of every sleep: one object reused, like the
+    SingletonGenerator of MicroPython's uasyncio (a sleep allocates
+    nothing), so sleep_ms() must be awaited right away."""
+
+    def __init__(self):
+        self.ms = None
+
+    def __call__(self, ms):
+        self.ms = ms
+        return self
+
+    def __await__(self):
+        return self
+
+    def __next__(self):
+        if self.ms is None:
+            raise StopIteration
+        ms, self.ms = self.ms, None
+        return ms
+
+
+class _Park:
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __await__(self):
+        yield self.obj
+
+
+sleep_ms = _Sleep()
+
+
+def sleep(s):
+    return sleep_ms(s * 1000)
+
+
+# ------------------------------------------------------------
+# Tasks and sync primitives
+# ------------------------------------------------------------
+class Task:
+    def __init__(self, coro):
+        self.coro = coro
+        self._done = False
+        self.result = None
+        self.exc = None
+        self.waiters = []
+        self.parked = None      # object we wait on, or the loop (sleep)
+        self.entry = None       # board queue entry while sleeping
+        self.cancel_pending = False
+
+    def done(self):
+        return self._done
+
+    def cancel(self):
+        if self._done:
+            return False
+        get_event_loop()._cancel(self)
+        return True
+
+    def _add_waiter(self, task):
+        self.waiters.append(task)
+
+    def _remove_waiter(self, task):
+        self.waiters.remove(task)
+
+    def __await__(self):
+        if not self._done:
+            yield self
+        if self.exc is not None:
+            raise self.exc
+        return self.result
+
+
+class Event:
+    def __init__(self):
+        self.state = False
+        self.waiters = []
+
+    def is_set(self):
+        return self.state
+
+    def set(self):
+        self.state = True
+        loop = get_event_loop()
+        for t in self.waiters:
+            loop._wake(t)
+        self.waiters = []
+
+    def clear(self):
+        self.state = False
+
+    async def wait(self):
+        get_event_loop().allocs += 1
+        if not self.state:
+            await _Park(self)
+        return True
+
+    def _add_waiter(self, task):
+        self.waiters.append(task)
+
+    def _remove_waiter(self, task):
+        self.waiters.remove(task)
+
+
+class _FlagWait:
+    """Awaitable of one ThreadSafeFlag.wait(): allocated here, as
+    uasyncio allocates the wait() generator."""
+
+    def __init__(self, flag):
+        get_event_loop().allocs += 1
+        self.flag = flag
+        self.parked = False
+
+    def __await__(self):
+        return self
+
+    def __next__(self):
+        if not self.parked and not self.flag.state:
+            self.parked = True
+            _io_queue.queue_read(self.flag)
+            return None
+        self.flag.state = False
+        raise StopIteration
+
+
+class ThreadSafeFlag:
+    """Set from IRQ context, one task waits; wait() clears the flag."""
+
+    def __init__(self):
+        self.state = False
+        self.waiter = None
+
+    def set(self):
+        self.state = True
+        if self.waiter is not None:
+            t, self.waiter = self.waiter, None
+            get_event_loop()._wake(t)
+
+    def clear(self):
+        self.state = False
+
+    def wait(self):
+        return _FlagWait(self)
+
+    def _add_waiter(self, task):
+        self.waiter = task
+
+    def _remove_waiter(self, task):
+        self.waiter = None
+
+
+class _IOQueue:
+    def queue_read(self, flag):
+        """Park the current task until flag is set; the caller then
+        yields None, as ThreadSafeFlag.wait() does in uasyncio. Counted
+        in Loop.io_entries: IOQueue._enqueue() allocates an entry list
+        and registers the flag with the poller."""
+        loop = get_event_loop()
+        loop.io_entries += 1
+        task = loop.current
+        task.parked = flag
+        flag._add_waiter(task)
+
+
+_io_queue = _IOQueue()
+core = sys.modules[__name__]    # uasyncio.core: _io_queue lives here too
+
+
+# ------------------------------------------------------------
+# Loop
+# ------------------------------------------------------------
+class Loop:
+    def __init__(self):
+        self.ready = deque()        # (task, exc)
+        self.current = None
+        self.wakeups = 0            # idle -> running transitions
+        self.steps = 0              # task resumptions
+        self.allocs = 0             # uasyncio heap objects (see top)
+        self.io_entries = 0         # IOQueue entries of flag waits (see top)
+        self.latency = None         # fn() -> us a sleep wakes late (load)
+        self.tasks = []
+
+    def create_task(self, coro):
+        self.allocs += 1
+        t = Task(coro)
+        self.tasks.append(t)
+        self.ready.append((t, None))
+        return t
+
+    def close(self):
+        """Close the coroutines of unfinished tasks (their finally blocks
+        run now, on this loop's board, not when garbage collected)."""
+        for t in self.tasks:
+            if not t.done():
+                t.coro.close()
+        self.tasks = []
+
+    def _wake(self, task, exc=None):
+        task.parked = None
+        task.entry = None
+        self.ready.append((task, exc))
+
+    def _cancel(self, task):
+        if task.parked is self:
+            board().cancel(task.entry)
+        elif task.parked is not None:
+            task.parked._remove_waiter(task)
+        elif task is self.current or any(t is task for t, _ in self.ready):
+            task.cancel_pending = True
+            return
+        self.allocs += 1
+        self._wake(task, CancelledError())
+
+    def _park(self, task, y):
+        if y is None:
+            if task.parked is None:
+                self.ready.append((task, None))
+        elif isinstance(y, (int, float)):
+            # MicroPython queues it at ticks_add(ticks_ms(), y): due on a
+            # ms boundary of the TIMER, or now if that is already past
+            b = board()
+            t = max(b.now_us, b.now_us - b.ticks_us() % 1000 + int(y * 1000))
+            if self.latency is not None:
+                t += self.latency()
+            task.parked = self
+            task.entry = b.schedule(t, self._wake, task)
+        else:
+            task.parked = y
+            y._add_waiter(task)
+
+    def _finish(self, task, result, exc):
+        task._done = True
+        task.result = result
+        task.exc = exc
+        for t in task.waiters:
+            self._wake(t)
+        if exc is not None and not task.waiters \
+                and not isinstance(exc, CancelledError):
+            raise exc
+        task.waiters = []
+
+    def _step(self, task, exc):
+        if task.cancel_pending:
+            task.cancel_pending = False
+            self.allocs += 1
+            exc = CancelledError()
+        self.current = task
+        self.steps += 1
+        board().count_step()
+        try:
+            if exc is not None:
+                y = task.coro.throw(exc)
+            else:
+                y = task.coro.send(None)
+        except StopIteration as e:
+            self._finish(task, e.value, None)
+        except CancelledError as e:
+            self._finish(task, None, e)
+        except Exception as e:
+            self._finish(task, None, e)
+        else:
+            self._park(task, y)
+        finally:
+            self.current = None
+
+    def run_until(self, t_us):
+        """Run tasks and jump from event to event up to t_us (events due
+        at exactly t_us run in the next call)."""
+        b = board()
+        b.horizon_us = t_us
+        while True:
+            while self.ready:
+                self._step(*self.ready.popleft())
+            t = b.next_time()
+            if t is None or t >= t_us:
+                b.now_us = max(b.now_us, t_us)
+                return
+            b.fire_next()
+            if self.ready:
+                self.wakeups += 1
+
+    def run_until_complete(self, task):
+        b = board()
+        while not task.done():
+            if not self.ready and b.next_time() is None:
+                raise RuntimeError("deadlock: no task or event can run")
+            self.run_until(b.now_us + 86_400_000_000)
+        return task.result
+
+
+def get_event_loop():
+    b = board()
+    if b.loop is None:
+        b.loop = Loop()
+    return b.loop
+
+
+def new_event_loop():
+    board().loop = Loop()
+    return board().loop
+
+
+def create_task(coro):
+    return get_event_loop().create_task(coro)
+
+
+def current_task():
+    return get_event_loop().current
+
+
+def run(coro):
+    loop = get_event_loop()
+    return loop.run_until_complete(loop.create_task(coro))
+
+
+async def wait_for(aw, timeout):
+    t = aw if isinstance(aw, Task) else create_task(aw)
+    if timeout is None:
+        return await t
+    expired = []
+
+    async def _timeout():
+        await sleep(timeout)
+        expired.append(True)
+        t.cancel()
+
+    tt = create_task(_timeout())
+    try:
+        return await t
+    except CancelledError:
+        if expired:
+            raise TimeoutError
+        t.cancel()
+        raise
+    finally:
+        tt.cancel()
+
+
+def wait_for_ms(aw, timeout):
+    return wait_for(aw, timeout / 1000)
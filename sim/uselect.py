@@ -0,0 +1,28 @@
+"""
+Fake uselect module: poll() on the USB serial stream.
+
+Every registered stream stands for stdout over USB CDC: writable while
+PLL_USB runs and the host reads (see Board.serial_writable()).
+"""
+
+from sim.core import board
+
+POLLIN = 1
+POLLOUT = 4
+
+
+class poll:
+    def __init__(self):
+        self.streams = {}
+
+    def register(self, obj, eventmask=POLLIN | POLLOUT):
+        self.streams[id(obj)] = (obj, eventmask)
+
+    def unregister(self, obj):
+        self.streams.pop(id(obj), None)
+
+    def poll(self, timeout=-1):
+        if not board().serial_writable():
+            return []
+        return [(obj, POLLOUT) for obj, mask in self.streams.values()
+                if mask & POLLOUT]
@@ -0,0 +1,6 @@
+"""
+Fake ustruct module: CPython's struct has the same pack_into() and
+unpack_from().
+"""
+
+from struct import calcsize, pack, pack_into, unpack, unpack_from  # noqa: F401
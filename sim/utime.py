@@ -0,0 +1,54 @@
+"""
+Fake utime module on the virtual clock.
+
+ticks_ms()/ticks_us() wrap at 2**30 like MicroPython, so ticks_add()
+and ticks_diff() must be used for arithmetic, as on the Pico.
+"""
+
+from sim.core import board
+
+TICKS_PERIOD = 1 << 30
+_TICKS_MAX = TICKS_PERIOD - 1
+_TICKS_HALF = TICKS_PERIOD // 2
+
+EPOCH_OFFSET = 0        # seconds of time() at board reset
+
+
+def ticks_ms():
+    return (board().ticks_us() // 1000) & _TICKS_MAX
+
+
+def ticks_us():
+    return board().ticks_us() & _TICKS_MAX
+
+
+def ticks_cpu():
+    return ticks_us()
+
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) & _TICKS_MAX
+
+
+def ticks_diff(ticks1, ticks2):
+    return ((ticks1 - ticks2 + _TICKS_HALF) & _TICKS_MAX) - _TICKS_HALF
+
+
+def sleep_ms(ms):
+    board().busy(int(ms) * 1000)
+
+
+def sleep_us(us):
+    board().busy(int(us))
+
+
+def sleep(s):
+    board().busy(int(s * 1_000_000))
+
+
+def time():
+    return EPOCH_OFFSET + board().now_us // 1_000_000
+
+
+def time_ns():
+    return (EPOCH_OFFSET * 1_000_000 + board().now_us) * 1000
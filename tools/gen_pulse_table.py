@@ -0,0 +1,65 @@
+"""
+Generate pulse_table.py: LED schedules for all 12 x 60 displayable times.
+
+    python tools/gen_pulse_table.py                 # classic -> ../pulse_table.py
+    python tools/gen_pulse_table.py morse out.py
+
+Each schedule is a run-length list of LED on/off durations from an
+encoder in encoders.py. Levels strictly alternate starting with ON, so
+only lengths are stored: one nibble per run in units of UNIT_MS, two
+runs per byte, high nibble first, 0 = end. INDEX holds 721
+little-endian uint16 byte offsets into TABLE; time h:mm (h 1–12) is
+entry (h - 1) * 60 + mm.
+
+Copy pulse_table.py to the Pico next to oneLedWatch.py, or freeze it
+into the firmware so TABLE stays in flash.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import encoders  # noqa: E402
+
+OUT = os.path.join(ROOT, "pulse_table.py")
+
+
+def _literal(name, data, width=24):
+    lines = ["%s = (" % name]
+    for i in range(0, len(data), width):
+        chunk = data[i:i + width]
+        lines.append('    b"%s"' % "".join("\\x%02x" % c for c in chunk))
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def render(name, index, table):
+    return "\n".join([
+        "# Generated by tools/gen_pulse_table.py - do not edit.",
+        "# LED schedules for all 12 x 60 times, see the generator for the format.",
+        "",
+        "ENCODER = %r" % name,
+        "UNIT_MS = %d" % encoders.UNIT_MS,
+        "",
+        _literal("INDEX", index),
+        "",
+        _literal("TABLE", table),
+        "",
+    ])
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    name = argv[0] if argv else "classic"
+    out = argv[1] if len(argv) > 1 else OUT
+    index, table = encoders.build(name)
+    with open(out, "w") as f:
+        f.write(render(name, index, table))
+    print("%s: %s, 720 times, %d + %d bytes"
+          % (out, name, len(index), len(table)))
+
+
+if __name__ == "__main__":
+    main()